@@ -23,13 +23,19 @@ def run_app():
         host = config["api"]["host"]
         port = config["api"]["port"]
         
-        # Run the application
+        reload = config["api"]["debug"]
+        
+        # Run the application on uvloop/httptools (uvloop is unavailable on Windows)
         print(f"Starting AI Support Agent on http://{host}:{port}")
         uvicorn.run(
             "ai_support_agent.main:app",
             host=host,
             port=port,
-            reload=config["api"]["debug"]
+            reload=reload,
+            workers=None if reload else config["api"]["workers"],
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            access_log=False
         )
     except ImportError as e:
         print(f"Error: {e}")
@@ -1,16 +1,39 @@
 """Service for analyzing differences between models using AI."""
-from typing import Dict, List, Optional, Any
-from pathlib import Path
+from typing import List, Optional, Tuple, AsyncIterator
+from dataclasses import asdict
 import logging
 
-from ..models.differences import Difference, Analysis
+import orjson
+
+from ..models.differences import Difference, Analysis, ValidationError
 from ..models.product import QueryIntent
 from ..llm.provider import LLMProvider
 from ..llm.factory import LLMProviderFactory
+from ..llm.cache import LLMCache
+from ..llm.semantic_cache import SemanticCache
 from ..config import get_llm_config
 
 logger = logging.getLogger(__name__)
 
+# Static response instructions, placed first so every analysis prompt shares a prefix
+_ANALYSIS_INSTRUCTIONS = """Please provide:
+1. A brief summary of the key differences
+2. The most important differences to consider
+3. Recommendations based on these differences
+4. Any relevant technical details
+
+Format your response as JSON with the following structure:
+{
+    "summary": "Brief overview of differences",
+    "key_differences": ["Important difference 1", "Important difference 2", ...],
+    "recommendations": ["Recommendation 1", "Recommendation 2", ...],
+    "technical_details": {
+        "detail1": "value1",
+        ...
+    }
+}"""
+
+
 class AIAIRecommendationAgent:
     """Service for analyzing differences between models using AI.
     
@@ -19,14 +42,32 @@ class AIAIRecommendationAgent:
     Compare Processor.
     """
     
-    def __init__(self, llm_provider: Optional[LLMProvider] = None):
+    def __init__(
+        self,
+        llm_provider: Optional[LLMProvider] = None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """Initialize the analyzer.
         
         Args:
             llm_provider: Optional LLM provider to use
+            cache: Optional response cache to use
+            semantic_cache: Optional cache for near-duplicate requests
         """
         self.llm_provider = llm_provider or LLMProviderFactory.create_provider()
         self.config = get_llm_config()
+        self.cache = cache or LLMCache.from_url(
+            self.config.get("cache_url"),
+            ttl=self.config.get("cache_ttl", 3600)
+        )
+        if semantic_cache is None and self.config.get("semantic_cache"):
+            semantic_cache = SemanticCache(
+                threshold=self.config.get("semantic_cache_threshold", 0.95)
+            )
+        self.semantic_cache = semantic_cache
+        # Deterministic (0.0) analyses are reproducible, which also makes them cacheable
+        self.analysis_temperature = self.config.get("analysis_temperature", 0.0)
         # Load system prompt from config or use default
         self.system_prompt = """You are an expert technical analyst specializing in magnetic sensors and relays.
             Your task is to analyze differences between product models and provide insights that would be valuable for customers.
@@ -50,45 +91,67 @@ class AIAIRecommendationAgent:
         Returns:
             str: The formatted prompt
         """
-        prompt = f"Please analyze the following differences between models, focusing on {intent.topic}"
+        parts = [
+            _ANALYSIS_INSTRUCTIONS,
+            "\n\n",
+            f"Please analyze the following differences between models, focusing on {intent.topic}"
+        ]
         if intent.sub_topic:
-            prompt += f" specifically regarding {intent.sub_topic}"
-        prompt += ":\n\n"
+            parts.append(f" specifically regarding {intent.sub_topic}")
+        parts.append(":\n\n")
         
-        for diff in differences:
-            prompt += f"- {diff.category} > {diff.subcategory} > {diff.specification}:\n"
-            prompt += f"  {diff.difference}"
-            if diff.unit:
-                prompt += f" ({diff.unit})"
-            prompt += "\n"
-            
-            # Add detailed values
-            prompt += "  Values by model:\n"
-            for model, value in diff.values.items():
-                prompt += f"    - {model}: {value}"
-                if diff.unit:
-                    prompt += f" {diff.unit}"
-                prompt += "\n"
-            prompt += "\n"
+        parts.extend(diff.prompt_fragment for diff in differences)
+        return "".join(parts)
+    
+    def _cache_key(
+        self,
+        differences: List[Difference],
+        intent: QueryIntent,
+        temperature: float
+    ) -> str:
+        """Build the response cache key for an analysis request.
         
-        prompt += """Please provide:
-1. A brief summary of the key differences
-2. The most important differences to consider
-3. Recommendations based on these differences
-4. Any relevant technical details
-
-Format your response as JSON with the following structure:
-{
-    "summary": "Brief overview of differences",
-    "key_differences": ["Important difference 1", "Important difference 2", ...],
-    "recommendations": ["Recommendation 1", "Recommendation 2", ...],
-    "technical_details": {
-        "detail1": "value1",
-        ...
-    }
-}"""
+        Args:
+            differences: List of differences to analyze
+            intent: Query intent to focus the analysis
+            temperature: Temperature used for generation
+            
+        Returns:
+            str: The cache key
+        """
+        diffs = sorted(
+            (asdict(diff) for diff in differences),
+            key=lambda d: (d["category"], d["subcategory"], d["specification"], d["model"])
+        )
+        return LLMCache.make_key({
+            "diffs": diffs,
+            "topic": intent.topic,
+            "sub": intent.sub_topic,
+            "sys": self.system_prompt,
+            "model": getattr(self.llm_provider, "model", None),
+            "temp": temperature
+        })
+    
+    def _semantic_cache_entry(
+        self,
+        differences: List[Difference],
+        intent: QueryIntent
+    ) -> Tuple[str, str]:
+        """Build the semantic cache scope and text for an analysis request.
+        
+        The scope requires an exact match on the compared models; only the
+        topic and specifications are matched semantically.
         
-        return prompt
+        Args:
+            differences: List of differences to analyze
+            intent: Query intent to focus the analysis
+            
+        Returns:
+            Tuple[str, str]: The scope and the text to embed
+        """
+        models = sorted({model for diff in differences for model in diff.values})
+        specs = ", ".join(diff.specification for diff in differences)
+        return ",".join(models), f"{intent.topic} | {intent.sub_topic or ''} | {specs}"
     
     async def analyze_differences(
         self,
@@ -111,28 +174,62 @@ Format your response as JSON with the following structure:
             ValueError: If analysis fails or response format is invalid
         """
         try:
+            temperature = self.analysis_temperature
+            
+            # Only deterministic generations are safe to serve from cache
+            cache_key = None
+            scope, text = self._semantic_cache_entry(differences, intent)
+            if temperature == 0:
+                cache_key = self._cache_key(differences, intent, temperature)
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Analysis cache hit for intent: {intent}")
+                    return Analysis(
+                        summary=cached["summary"],
+                        key_differences=cached["key_differences"],
+                        recommendations=cached["recommendations"],
+                        technical_details=cached.get("technical_details")
+                    )
+                
+                if self.semantic_cache is not None:
+                    cached = await self.semantic_cache.get(scope, text)
+                    if cached is not None:
+                        logger.debug(f"Analysis semantic cache hit for intent: {intent}")
+                        return Analysis(
+                            summary=cached["summary"],
+                            key_differences=cached["key_differences"],
+                            recommendations=cached["recommendations"],
+                            technical_details=cached.get("technical_details")
+                        )
+            
             # Create and send prompt with system prompt
             prompt = self._create_analysis_prompt(differences, intent)
             
-            # Get temperature from config
-            temperature = self.config.get("temperature", 0.7)
-            
             logger.debug(f"Sending analysis prompt with intent: {intent}")
-            response = await self.llm_provider.generate_json(
+            response = await self.llm_provider.agenerate_json(
                 prompt=prompt,
                 system_prompt=self.system_prompt,
-                temperature=temperature
+                temperature=temperature,
+                semantic_scope=scope,
+                semantic_text=text
             )
             
             # Parse response into Analysis object
             data = response.content
-            return Analysis(
+            analysis = Analysis(
                 summary=data["summary"],
                 key_differences=data["key_differences"],
                 recommendations=data["recommendations"],
                 technical_details=data.get("technical_details")
             )
             
+            if cache_key is not None:
+                await self.cache.set(cache_key, analysis.to_dict())
+                if self.semantic_cache is not None:
+                    await self.semantic_cache.set(scope, text, analysis.to_dict())
+            
+            return analysis
+            
         except (KeyError, TypeError) as e:
             logger.error(f"Failed to parse AI response: {str(e)}")
             # Return error analysis that frontend can handle
@@ -148,4 +245,86 @@ Format your response as JSON with the following structure:
             
         except Exception as e:
             logger.error(f"Unexpected error in analyze_differences: {str(e)}")
-            raise ValueError(f"Failed to analyze differences: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to analyze differences: {str(e)}")
+    
+    async def stream_differences(
+        self,
+        differences: List[Difference],
+        intent: QueryIntent
+    ) -> AsyncIterator[str]:
+        """Stream the raw JSON analysis of differences as it is generated.
+        
+        Cached analyses are emitted as a single chunk. Deterministic streams
+        are cached once the assembled text parses as an analysis.
+        
+        Args:
+            differences: List of differences to analyze
+            intent: Query intent to focus the analysis
+            
+        Yields:
+            str: Chunks of the JSON analysis text
+            
+        Raises:
+            ValueError: If streaming fails
+        """
+        try:
+            temperature = self.analysis_temperature
+            
+            cache_key = None
+            if temperature == 0:
+                cache_key = self._cache_key(differences, intent, temperature)
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    yield orjson.dumps(cached).decode()
+                    return
+            
+            prompt = self._create_analysis_prompt(differences, intent)
+            
+            logger.debug(f"Streaming analysis prompt with intent: {intent}")
+            parts: List[str] = []
+            async for chunk in self.llm_provider.stream_json(
+                prompt=prompt,
+                system_prompt=self.system_prompt,
+                temperature=temperature
+            ):
+                parts.append(chunk)
+                yield chunk
+            
+            if cache_key is not None:
+                await self._cache_streamed_analysis(cache_key, differences, intent, "".join(parts))
+                
+        except Exception as e:
+            logger.error(f"Unexpected error in stream_differences: {str(e)}")
+            raise ValueError(f"Failed to stream analysis: {str(e)}")
+    
+    async def _cache_streamed_analysis(
+        self,
+        cache_key: str,
+        differences: List[Difference],
+        intent: QueryIntent,
+        text: str
+    ) -> None:
+        """Cache a streamed analysis once it has been fully received.
+        
+        Args:
+            cache_key: The response cache key for the request
+            differences: List of differences that were analyzed
+            intent: Query intent the analysis focused on
+            text: The assembled JSON analysis text
+        """
+        try:
+            data = orjson.loads(text)
+            analysis = Analysis(
+                summary=data["summary"],
+                key_differences=data["key_differences"],
+                recommendations=data["recommendations"],
+                technical_details=data.get("technical_details")
+            )
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValidationError) as e:
+            logger.warning(f"Streamed analysis is invalid, not caching: {str(e)}")
+            return
+        
+        await self.cache.set(cache_key, analysis.to_dict())
+        if self.semantic_cache is not None:
+            scope, semantic_text = self._semantic_cache_entry(differences, intent)
+            await self.semantic_cache.set(scope, semantic_text, analysis.to_dict())
@@ -1,17 +1,27 @@
 """Customer support agent for handling product queries."""
 from typing import Dict, List, Optional, Any
 import re
-import json
 import logging
 
+import orjson
+
 from ..models.agent import BaseAgent
 from ..tools.pdf_processor import PDFProcessor
 from ..tools.compare_processor import CompareProcessor
 from ..tools.ai_difference_analyzer import AIDifferenceAnalyzer
 from ..llm import LLMProvider, get_provider
+from ..llm.semantic_cache import SemanticCache
+from ..config import get_llm_config
 
 logger = logging.getLogger(__name__)
 
+# Model numbers like HSR-412R, HSR412R, or any hyphenated alphanumeric code
+_MODEL_RE = re.compile(r'([A-Z]{2,4}-?[0-9]{3,5}[A-Z]?|[A-Z0-9]+-[A-Z0-9]+)')
+
+# Keyword patterns for the rule-based intent fallback
+_COMPARISON_RE = re.compile(r'\b(?:compar(?:e[sd]?|ing|ison)|versus|vs|differences?)\b', re.IGNORECASE)
+_FEATURE_RE = re.compile(r'\b(?:features?|advantages?|benefits?)\b', re.IGNORECASE)
+
 
 class CustomerSupportAgent(BaseAgent[None]):
     """Agent for handling customer support queries.
@@ -26,7 +36,8 @@ class CustomerSupportAgent(BaseAgent[None]):
         pdf_processor: Optional[PDFProcessor] = None,
         compare_processor: Optional[CompareProcessor] = None,
         difference_analyzer: Optional[AIDifferenceAnalyzer] = None,
-        llm_provider: Optional[LLMProvider] = None
+        llm_provider: Optional[LLMProvider] = None,
+        semantic_cache: Optional[SemanticCache] = None
     ):
         """Initialize the customer support agent.
         
@@ -35,12 +46,27 @@ class CustomerSupportAgent(BaseAgent[None]):
             compare_processor: Optional compare processor to use
             difference_analyzer: Optional difference analyzer to use
             llm_provider: Optional LLM provider to use
+            semantic_cache: Optional cache for paraphrased queries (built from
+                config when enabled and not given)
         """
         super().__init__()
         self.llm_provider = llm_provider or get_provider()
         self.pdf_processor = pdf_processor or PDFProcessor()
         self.compare_processor = compare_processor or CompareProcessor()
         self.difference_analyzer = difference_analyzer or AIDifferenceAnalyzer(self.llm_provider)
+        if semantic_cache is None:
+            config = get_llm_config()
+            if config.get("semantic_cache"):
+                semantic_cache = SemanticCache(
+                    threshold=config.get("semantic_cache_threshold", 0.95)
+                )
+        self.semantic_cache = semantic_cache
+        
+        # Query domain to handler, taking (model_numbers, topic)
+        self._domain_handlers = {
+            "product": self._route_product,
+            "comparison": self._route_comparison
+        }
     
     def get_system_message(self) -> str:
         """Get the system message for the agent."""
@@ -72,17 +98,26 @@ Respond with a JSON object containing:
             
             # If we have an LLM provider, use it to analyze the query
             if self.llm_provider:
-                response = await self.llm_provider.generate_text(
+                # Paraphrased queries about the same models share an analysis
+                scope = ",".join(sorted(model_numbers))
+                if self.semantic_cache is not None:
+                    cached = await self.semantic_cache.get(scope, query)
+                    if cached is not None:
+                        return dict(cached)
+                
+                response = await self.llm_provider.agenerate_text(
                     prompt=self._generate_query_prompt(query)
                 )
                 
                 # Parse the response as JSON
                 try:
-                    result = json.loads(response.content)
+                    result = orjson.loads(response.content)
                     result["model_numbers"] = result.get("model_numbers", model_numbers)
                     result["source"] = "llm"
+                    if self.semantic_cache is not None:
+                        await self.semantic_cache.set(scope, query, result)
                     return result
-                except (json.JSONDecodeError, KeyError) as e:
+                except (orjson.JSONDecodeError, KeyError) as e:
                     logger.warning(f"Failed to parse LLM response: {str(e)}")
             
             # Rule-based analysis as fallback
@@ -90,13 +125,11 @@ Respond with a JSON object containing:
             topic = "specifications"
             
             # Check for comparison intent
-            comparison_keywords = ["compare", "comparison", "versus", "vs", "difference", "differences"]
-            if any(keyword in query.lower() for keyword in comparison_keywords) and len(model_numbers) > 1:
+            if len(model_numbers) > 1 and _COMPARISON_RE.search(query):
                 domain = "comparison"
             
             # Check for features intent
-            feature_keywords = ["feature", "features", "advantage", "advantages", "benefit", "benefits"]
-            if any(keyword in query.lower() for keyword in feature_keywords):
+            if _FEATURE_RE.search(query):
                 topic = "features"
             
             return {
@@ -122,36 +155,51 @@ Respond with a JSON object containing:
         analysis = await self.analyze_query(query)
         
         # Route to the appropriate handler based on intent
-        if analysis["domain"] == "product" and analysis["model_numbers"]:
-            # Handle single product query
-            return await self._handle_product_query(
-                analysis["model_numbers"][0],
-                analysis["topic"]
-            )
-        elif analysis["domain"] == "comparison" and len(analysis["model_numbers"]) > 1:
-            # Handle comparison query
-            comparison = await self.compare_processor.compare_models(analysis["model_numbers"])
-            
-            # If the topic is features, return the comparison as is
-            if analysis["topic"] == "features":
-                return comparison.to_dict()
-            
-            # Otherwise, analyze the differences
-            result = await self.difference_analyzer.analyze_differences(
-                comparison,
-                analysis["topic"]
-            )
-            return result.to_dict()
-        else:
-            # Default to handling the first model if available
-            if analysis["model_numbers"]:
-                return await self._handle_product_query(
-                    analysis["model_numbers"][0],
-                    analysis["topic"]
-                )
+        handler = self._domain_handlers.get(analysis["domain"], self._route_product)
+        return await handler(analysis["model_numbers"], analysis["topic"])
+    
+    async def _route_product(self, model_numbers: List[str], topic: str) -> Dict[str, Any]:
+        """Route a query to the first model's product information.
+        
+        This is also the fallback for unknown domains.
+        
+        Args:
+            model_numbers: The model numbers from the query
+            topic: The query topic
+            
+        Returns:
+            Dict[str, Any]: The product information
             
-            # If no model numbers, return an error
+        Raises:
+            ValueError: If no model numbers were found
+        """
+        if not model_numbers:
             raise ValueError("No model numbers found in query")
+        return await self._handle_product_query(model_numbers[0], topic)
+    
+    async def _route_comparison(self, model_numbers: List[str], topic: str) -> Dict[str, Any]:
+        """Route a query to a model comparison.
+        
+        Args:
+            model_numbers: The model numbers from the query
+            topic: The query topic
+            
+        Returns:
+            Dict[str, Any]: The comparison or its analysis
+        """
+        # A comparison needs at least two models
+        if len(model_numbers) < 2:
+            return await self._route_product(model_numbers, topic)
+        
+        comparison = await self.compare_processor.compare_models(model_numbers)
+        
+        # If the topic is features, return the comparison as is
+        if topic == "features":
+            return comparison.to_dict()
+        
+        # Otherwise, analyze the differences
+        result = await self.difference_analyzer.analyze_differences(comparison, topic)
+        return result.to_dict()
     
     async def _handle_product_query(
         self,
@@ -168,8 +216,9 @@ Respond with a JSON object containing:
             Dict[str, Any]: The product information
         """
         try:
-            # Get product content
-            content = self.pdf_processor.get_content(model_number)
+            # Features and advantages live on the first page, so skip the spec tables
+            pages = [1] if topic == "features" else None
+            content = await self.pdf_processor.get_content(model_number, pages=pages)
             
             # Filter sections based on intent
             sections = {}
@@ -205,22 +254,8 @@ Respond with a JSON object containing:
         Returns:
             List[str]: The extracted model numbers
         """
-        # Common patterns for model numbers
-        patterns = [
-            r'([A-Z0-9]+-[A-Z0-9]+)',  # Pattern like HSR-412R
-            r'([A-Z]{2,4}[0-9]{3,5}[A-Z]?)',  # Pattern like HSR412R
-            r'([A-Z]{2,4}-?[0-9]{3,5}[A-Z]?)'  # Pattern like HSR-412R or HSR412R
-        ]
-        
-        model_numbers = []
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, query)
-            model_numbers.extend(matches)
-        
         # Remove duplicates while preserving order
-        seen = set()
-        return [x for x in model_numbers if not (x in seen or seen.add(x))]
+        return list(dict.fromkeys(_MODEL_RE.findall(query)))
     
     def _generate_query_prompt(self, query: str) -> str:
         """Generate a prompt for the query.
@@ -1,21 +1,37 @@
 """API routes for the customer support agent."""
-from typing import Dict, List, Optional, Any
+import asyncio
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, AsyncIterator
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..agents.customer_support_agent import CustomerSupportAgent
+from ..agents.ai_recommendation_agent import AIAIRecommendationAgent
 from ..models.product import QueryIntent
 from ..models.comparison import ComparisonResponse
 from ..models.differences import Analysis
 
 
+# Streamed chunks are buffered until either limit is reached
+STREAM_FLUSH_INTERVAL = 0.05
+STREAM_FLUSH_BYTES = 512
+
+
 # Create FastAPI router
-router = APIRouter(prefix="/api", tags=["Customer Support"])
+router = APIRouter(
+    prefix="/api",
+    tags=["Customer Support"],
+    default_response_class=ORJSONResponse
+)
 
 
 # Error handling
 class ErrorResponse(BaseModel):
     """Error response model."""
+    model_config = ConfigDict(frozen=True)
+
     detail: str = Field(..., description="Error message")
     error_type: str = Field(..., description="Type of error")
 
@@ -23,21 +39,29 @@ class ErrorResponse(BaseModel):
 # Request and response models
 class QueryRequest(BaseModel):
     """Request model for query endpoint."""
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
     query: str = Field(..., description="User query to process")
 
 
 class QueryResponse(BaseModel):
     """Response model for query endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     result: Dict[str, Any] = Field(..., description="Query result")
 
 
 class ModelListResponse(BaseModel):
     """Response model for model listing."""
+    model_config = ConfigDict(frozen=True)
+
     models: List[str] = Field(..., description="List of available model numbers")
 
 
 class ModelInfoResponse(BaseModel):
     """Response model for model information."""
+    model_config = ConfigDict(frozen=True)
+
     specifications: Dict[str, Any] = Field(..., description="Model specifications")
     features: Optional[List[str]] = Field(None, description="Model features")
     advantages: Optional[List[str]] = Field(None, description="Model advantages")
@@ -45,17 +69,48 @@ class ModelInfoResponse(BaseModel):
 
 class CompareRequest(BaseModel):
     """Request model for model comparison."""
-    model_numbers: List[str] = Field(..., min_items=2, description="List of model numbers to compare")
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
+    model_numbers: List[str] = Field(..., min_length=2, description="List of model numbers to compare")
 
 
 class AnalyzeRequest(BaseModel):
     """Request model for difference analysis."""
-    model_numbers: List[str] = Field(..., min_items=2, description="List of model numbers to analyze")
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
+    model_numbers: List[str] = Field(..., min_length=2, description="List of model numbers to analyze")
     topic: str = Field("specifications", description="Topic to focus on")
     sub_topic: Optional[str] = Field(None, description="Optional sub-topic to focus on")
 
 
+class AnalyzeBatchRequest(BaseModel):
+    """Request model for batched difference analysis."""
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
+    items: List[AnalyzeRequest] = Field(..., min_length=1, description="Analysis requests to run concurrently")
+
+
+class AnalyzeBatchResponse(BaseModel):
+    """Response model for batched difference analysis."""
+    model_config = ConfigDict(frozen=True)
+
+    results: List[Dict[str, Any]] = Field(..., description="Analysis result or error per request, in request order")
+
+
 # Error handling
+def _batch_error(e: Exception) -> Dict[str, Any]:
+    """Convert a failed batch item into an error entry.
+    
+    Args:
+        e: The exception raised for the item
+        
+    Returns:
+        Dict[str, Any]: The error entry
+    """
+    error = handle_customer_support_error(e)
+    return {"detail": error.detail, "error_type": error.headers["error_type"]}
+
+
 def handle_customer_support_error(e: Exception) -> HTTPException:
     """Handle customer support errors.
     
@@ -86,8 +141,12 @@ def handle_customer_support_error(e: Exception) -> HTTPException:
 
 
 # Dependency to get the customer support agent
+@lru_cache(maxsize=1)
 def get_customer_support_agent() -> CustomerSupportAgent:
-    """Get the customer support agent.
+    """Get the shared customer support agent.
+    
+    The agent holds no per-request state, so a single instance is built on
+    first use and reused by every request.
     
     Returns:
         CustomerSupportAgent: The customer support agent
@@ -95,6 +154,17 @@ def get_customer_support_agent() -> CustomerSupportAgent:
     return CustomerSupportAgent()
 
 
+# Dependency to get the recommendation agent
+@lru_cache(maxsize=1)
+def get_recommendation_agent() -> AIAIRecommendationAgent:
+    """Get the shared recommendation agent.
+    
+    Returns:
+        AIAIRecommendationAgent: The recommendation agent
+    """
+    return AIAIRecommendationAgent()
+
+
 @router.post(
     "/query",
     response_model=QueryResponse,
@@ -158,11 +228,16 @@ async def list_models(
         pdf_dir = agent.pdf_processor.data_dir
         
         # Extract model numbers from filenames
-        model_numbers = []
-        for file in pdf_dir.glob("*.pdf"):
-            model_number = agent.pdf_processor._extract_model_name(file.stem)
-            if model_number:
-                model_numbers.append(model_number)
+        def scan() -> List[str]:
+            model_numbers = []
+            for file in pdf_dir.glob("*.pdf"):
+                model_number = agent.pdf_processor._extract_model_name(file.stem)
+                if model_number:
+                    model_numbers.append(model_number)
+            return model_numbers
+        
+        # Scan off the event loop so directory I/O doesn't block other requests
+        model_numbers = await asyncio.to_thread(scan)
         
         return ModelListResponse(models=sorted(model_numbers))
     except Exception as e:
@@ -216,8 +291,11 @@ async def get_model_info(
 
 @router.post(
     "/compare",
-    response_model=ComparisonResponse,
+    # Handler already returns a ComparisonResponse; skip FastAPI's second validation pass
+    # and keep the schema in OpenAPI via `responses`
+    response_model=None,
     responses={
+        200: {"model": ComparisonResponse},
         400: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
@@ -249,8 +327,11 @@ async def compare_models(
 
 @router.post(
     "/analyze",
-    response_model=Analysis,
+    # Handler already returns a Analysis; skip FastAPI's second validation pass
+    # and keep the schema in OpenAPI via `responses`
+    response_model=None,
     responses={
+        200: {"model": Analysis},
         400: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
@@ -290,4 +371,160 @@ async def analyze_differences(
         
         return result
     except Exception as e:
-        raise handle_customer_support_error(e) 
\ No newline at end of file
+        raise handle_customer_support_error(e)
+
+
+@router.post(
+    "/analyze_batch",
+    response_model=AnalyzeBatchResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    }
+)
+async def analyze_differences_batch(
+    request: AnalyzeBatchRequest,
+    agent: CustomerSupportAgent = Depends(get_customer_support_agent),
+    recommender: AIAIRecommendationAgent = Depends(get_recommendation_agent)
+) -> AnalyzeBatchResponse:
+    """Analyze differences for several model sets concurrently.
+    
+    All comparisons run concurrently, then all LLM analyses run
+    concurrently, so the batch takes roughly as long as its slowest item.
+    
+    Args:
+        request: The batch analysis request
+        agent: The customer support agent
+        recommender: The recommendation agent producing the analyses
+        
+    Returns:
+        AnalyzeBatchResponse: Analysis result or error per request
+        
+    Raises:
+        HTTPException: If the batch cannot be processed
+    """
+    try:
+        found = await asyncio.gather(
+            *(agent.compare_processor.find_differences(item.model_numbers) for item in request.items),
+            return_exceptions=True
+        )
+        
+        async def analyze(item: AnalyzeRequest, differences: Any) -> Any:
+            if isinstance(differences, Exception):
+                return differences
+            intent = QueryIntent(
+                domain="comparison",
+                topic=item.topic,
+                sub_topic=item.sub_topic
+            )
+            return await recommender.analyze_differences(differences, intent)
+        
+        analyses = await asyncio.gather(
+            *(analyze(item, differences) for item, differences in zip(request.items, found)),
+            return_exceptions=True
+        )
+        
+        return AnalyzeBatchResponse(results=[
+            _batch_error(result) if isinstance(result, Exception) else result.to_dict()
+            for result in analyses
+        ])
+    except Exception as e:
+        raise handle_customer_support_error(e)
+
+
+async def _prepend(first: Optional[str], chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Yield an already received chunk, if any, followed by the rest.
+    
+    Args:
+        first: The chunk taken from the iterator before streaming began
+        chunks: The remaining chunks
+        
+    Yields:
+        str: The chunks in order
+    """
+    if first is not None:
+        yield first
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _batched_ndjson(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Coalesce streamed text chunks into NDJSON lines.
+    
+    Chunks are buffered until STREAM_FLUSH_INTERVAL seconds have passed or
+    STREAM_FLUSH_BYTES characters have accumulated, so the HTTP layer is not
+    driven once per token.
+    
+    Args:
+        chunks: Text chunks to forward
+        
+    Yields:
+        bytes: One ``{"delta": ...}`` line per flushed batch, then ``{"done": true}``
+    """
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    size = 0
+    last_flush = loop.time()
+    try:
+        async for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= STREAM_FLUSH_BYTES or loop.time() - last_flush >= STREAM_FLUSH_INTERVAL:
+                yield orjson.dumps({"delta": "".join(buffer)}) + b"\n"
+                buffer.clear()
+                size = 0
+                last_flush = loop.time()
+        if buffer:
+            yield orjson.dumps({"delta": "".join(buffer)}) + b"\n"
+        yield orjson.dumps({"done": True}) + b"\n"
+    except Exception as e:
+        error = handle_customer_support_error(e)
+        yield orjson.dumps({"detail": error.detail, "error_type": error.headers["error_type"]}) + b"\n"
+
+
+@router.post(
+    "/analyze/stream",
+    response_class=StreamingResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    }
+)
+async def stream_analyze_differences(
+    request: AnalyzeRequest,
+    agent: CustomerSupportAgent = Depends(get_customer_support_agent),
+    recommender: AIAIRecommendationAgent = Depends(get_recommendation_agent)
+) -> StreamingResponse:
+    """Stream the analysis of differences between models.
+    
+    The response is newline-delimited JSON: ``{"delta": ...}`` lines carrying
+    the raw analysis text as it is generated, followed by ``{"done": true}``.
+    
+    Args:
+        request: The analysis request
+        agent: The customer support agent
+        recommender: The recommendation agent producing the analysis
+        
+    Returns:
+        StreamingResponse: NDJSON stream of the analysis
+        
+    Raises:
+        HTTPException: If the comparison fails or the analysis cannot start
+    """
+    try:
+        intent = QueryIntent(
+            domain="comparison",
+            topic=request.topic,
+            sub_topic=request.sub_topic
+        )
+        differences = await agent.compare_processor.find_differences(request.model_numbers)
+        chunks = recommender.stream_differences(differences, intent)
+        
+        # Wait for the first chunk so failures to start are reported with an error status
+        first = await anext(chunks, None)
+        return StreamingResponse(
+            _batched_ndjson(_prepend(first, chunks)),
+            media_type="application/x-ndjson"
+        )
+    except Exception as e:
+        raise handle_customer_support_error(e)
@@ -1,5 +1,5 @@
 """Configuration module for the AI Support Agent."""
 
-from .config import get_config, ensure_directories_exist
+from .config import get_config, get_llm_config, ensure_directories_exist
 
-__all__ = ["get_config", "ensure_directories_exist"]
+__all__ = ["get_config", "get_llm_config", "ensure_directories_exist"]
@@ -5,6 +5,7 @@ This module handles loading and accessing configuration settings from environmen
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -15,6 +16,7 @@ config: Dict[str, Any] = {
         "host": os.getenv("API_HOST", "0.0.0.0"),
         "port": int(os.getenv("API_PORT", "8000")),
         "debug": os.getenv("DEBUG", "False").lower() in ("true", "1", "t"),
+        "workers": int(os.getenv("WORKERS", "1")),
     },
     
     # Path Configuration
@@ -25,32 +27,86 @@ config: Dict[str, Any] = {
         "processed_dir": os.getenv("PROCESSED_DIR", "./data/processed"),
     },
     
+    # LLM Configuration
+    "llm": {
+        "provider": os.getenv("LLM_PROVIDER", "gemini"),
+        "model": os.getenv("LLM_MODEL", "gemini-1.5-flash"),
+        "api_key": os.getenv("GEMINI_API_KEY", ""),
+        "temperature": float(os.getenv("LLM_TEMPERATURE", "0.0")),
+        "analysis_temperature": float(os.getenv("LLM_ANALYSIS_TEMPERATURE", "0.0")),
+        "max_tokens": int(os.getenv("LLM_MAX_TOKENS", "2048")),
+        "max_concurrency": int(os.getenv("GEMINI_MAX_CONCURRENCY", "8")),
+        "transport": os.getenv("GEMINI_TRANSPORT"),
+        "cache_url": os.getenv("LLM_CACHE_URL"),
+        "cache_ttl": int(os.getenv("LLM_CACHE_TTL", "3600")),
+        "response_cache_size": int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "1024")),
+        "response_cache_ttl": int(os.getenv("LLM_RESPONSE_CACHE_TTL", "1800")),
+        "semantic_cache": os.getenv("LLM_SEMANTIC_CACHE", "False").lower() in ("true", "1", "t"),
+        "semantic_cache_threshold": float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.95")),
+        "provider_semantic_cache": os.getenv("LLM_PROVIDER_SEMANTIC_CACHE", "False").lower() in ("true", "1", "t"),
+        "provider_semantic_cache_threshold": float(os.getenv("LLM_PROVIDER_SEMANTIC_CACHE_THRESHOLD", "0.92")),
+    },
+    
+    # PDF Processing
+    "pdf": {
+        "table_strategy": os.getenv("PDF_TABLE_STRATEGY", "lines"),
+        "table_snap_tolerance": float(os.getenv("PDF_TABLE_SNAP_TOLERANCE", "3")),
+        "table_intersection_tolerance": float(os.getenv("PDF_TABLE_INTERSECTION_TOLERANCE", "3")),
+        "max_workers": int(os.getenv("PDF_MAX_WORKERS", "2")),
+        # Pickled PDFContent per file version; kept out of the data directory
+        "cache": os.getenv("PDF_CACHE", "True").lower() in ("true", "1", "t"),
+        "cache_dir": os.getenv(
+            "PDF_CACHE_DIR",
+            str(Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "ai_support_agent" / "pdf")
+        ),
+    },
+    
     # Logging
     "logging": {
         "log_level": os.getenv("LOG_LEVEL", "INFO"),
     },
 }
 
+# Set once the configured directories have been created
+_dirs_checked = False
+
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
     """
     Get the configuration settings from environment variables.
     
+    The result is cached, so repeated calls return the same dictionary.
+    
     Returns:
         Dict[str, Any]: A dictionary containing the configuration settings.
     """
     return config
 
+@lru_cache(maxsize=1)
+def get_llm_config() -> Dict[str, Any]:
+    """
+    Get the LLM configuration settings.
+    
+    The result is cached, so repeated calls return the same dictionary.
+    
+    Returns:
+        Dict[str, Any]: A dictionary containing the LLM settings.
+    """
+    return get_config()["llm"]
+
 def ensure_directories_exist() -> None:
     """
     Ensure that the necessary directories exist.
     
-    Creates all required directories if they don't exist.
+    Creates all required directories if they don't exist. Only the first
+    call per process touches the filesystem.
     """
-    config = get_config()
-    paths = config["paths"]
-    
-    # Create all directories if they don't exist
-    for dir_path in paths.values():
-        path = Path(dir_path)
-        if not path.exists():
-            path.mkdir(parents=True, exist_ok=True) 
\ No newline at end of file
+    global _dirs_checked
+    if _dirs_checked:
+        return
+    
+    # mkdir with exist_ok already no-ops on existing directories
+    for dir_path in get_config()["paths"].values():
+        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    
+    _dirs_checked = True 
\ No newline at end of file
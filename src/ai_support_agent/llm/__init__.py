@@ -1,25 +1,46 @@
 """LLM module for AI Support Agent."""
 
+from typing import Optional
+
 from .provider import LLMProvider, LLMResponse
 from .factory import LLMProviderFactory
+from .cache import LLMCache, CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from .semantic_cache import SemanticCache, SentenceTransformerEmbedder
 
 # Import providers to ensure registration
 from . import providers
 
+# Configured provider, resolved on first use
+_default_provider: Optional[LLMProvider] = None
+
 # Convenience function to get a provider instance
 def get_provider(provider_name: str = None) -> LLMProvider:
     """Get an LLM provider instance.
     
+    The configured default provider is resolved once and returned directly
+    on later calls.
+    
     Args:
         provider_name: Optional name of the provider (defaults to configured provider)
         
     Returns:
         LLMProvider: Provider instance
     """
+    global _default_provider
+    if provider_name is None:
+        if _default_provider is None:
+            _default_provider = LLMProviderFactory.create_provider()
+        return _default_provider
     return LLMProviderFactory.get_provider(provider_name)
 
 __all__ = [
     "LLMProvider",
     "LLMResponse",
+    "LLMCache",
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "SemanticCache",
+    "SentenceTransformerEmbedder",
     "get_provider"
 ] 
\ No newline at end of file
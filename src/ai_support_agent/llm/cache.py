@@ -0,0 +1,217 @@
+"""Response caching for LLM calls."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface used by the LLM cache."""
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value if present
+        """
+        ...
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Optional time to live in seconds
+        """
+        ...
+
+
+class InMemoryCacheBackend:
+    """In-process LRU cache backend.
+
+    Suitable for development and single-worker deployments. Safe to share
+    between the event loop and worker threads.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> Optional[Any]:
+        """Get a cached value synchronously, dropping it if expired.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Optional[Any]: The cached value if present
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def store(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value synchronously, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Optional time to live in seconds
+        """
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value, dropping it if expired."""
+        return self.lookup(key)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self.store(key, value, ttl)
+
+
+class RedisCacheBackend:
+    """Redis cache backend for multi-worker deployments.
+
+    Requires the optional ``redis`` package.
+    """
+
+    def __init__(self, url: str, prefix: str = "llm:"):
+        """Initialize the backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Prefix applied to every key
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError("RedisCacheBackend requires the 'redis' package") from e
+        self._client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value."""
+        raw = await self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a value."""
+        await self._client.set(self.prefix + key, json.dumps(value), ex=ttl)
+
+
+class LLMCache:
+    """Exact-match cache for LLM responses.
+
+    Keys are SHA-256 hashes of the normalized request payload, so only
+    identical requests share an entry.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: int = 3600):
+        """Initialize the cache.
+
+        Args:
+            backend: Optional storage backend (defaults to in-memory LRU)
+            ttl: Time to live for entries in seconds
+        """
+        self.backend = backend or InMemoryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_url(cls, url: Optional[str] = None, ttl: int = 3600) -> "LLMCache":
+        """Create a cache, using Redis when a URL is given.
+
+        Args:
+            url: Optional Redis connection URL
+            ttl: Time to live for entries in seconds
+
+        Returns:
+            LLMCache: The cache instance
+        """
+        backend = RedisCacheBackend(url) if url else InMemoryCacheBackend()
+        return cls(backend=backend, ttl=ttl)
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Build a cache key from a request payload.
+
+        Args:
+            payload: JSON-serializable request description
+
+        Returns:
+            str: Hex digest of the normalized payload
+        """
+        normalized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response and record the hit or miss.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached response if present
+        """
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {str(e)}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response.
+
+        Args:
+            key: The cache key
+            value: The response to store
+        """
+        try:
+            await self.backend.set(key, value, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters.
+
+        Returns:
+            Dict[str, int]: Cache statistics
+        """
+        return {"hits": self.hits, "misses": self.misses}
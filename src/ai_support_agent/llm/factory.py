@@ -1,7 +1,9 @@
 """Factory for creating LLM providers."""
 
+import importlib
 import logging
-from typing import Dict, Type, Optional
+import threading
+from typing import Dict, Type, Optional, Union
 
 from .provider import LLMProvider
 from ..config.config import get_llm_config
@@ -12,20 +14,40 @@ logger = logging.getLogger(__name__)
 class LLMProviderFactory:
     """Factory for creating LLM providers."""
     
-    _providers: Dict[str, Type[LLMProvider]] = {}
+    # Values are provider classes or "module:Class" paths imported on first use
+    _providers: Dict[str, Union[Type[LLMProvider], str]] = {}
     _instances: Dict[str, LLMProvider] = {}
+    _lock = threading.Lock()
     
     @classmethod
-    def register_provider(cls, name: str, provider_class: Type[LLMProvider]) -> None:
+    def register_provider(cls, name: str, provider_class: Union[Type[LLMProvider], str]) -> None:
         """Register a new provider.
         
         Args:
             name: Name of the provider
-            provider_class: Provider class to register
+            provider_class: Provider class, or a "module:Class" import path
+                so heavy SDKs are only imported when the provider is used
         """
         cls._providers[name.lower()] = provider_class
         logger.info(f"Registered provider: {name}")
     
+    @classmethod
+    def _resolve_provider_class(cls, provider_name: str) -> Optional[Type[LLMProvider]]:
+        """Get a registered provider class, importing it if registered by path.
+        
+        Args:
+            provider_name: Lower-cased name of the provider
+            
+        Returns:
+            Optional[Type[LLMProvider]]: The provider class, or None if not registered
+        """
+        provider_class = cls._providers.get(provider_name)
+        if isinstance(provider_class, str):
+            module_name, _, class_name = provider_class.partition(":")
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+            cls._providers[provider_name] = provider_class
+        return provider_class
+    
     @classmethod
     def create_provider(cls, provider_name: Optional[str] = None) -> LLMProvider:
         """Create a provider instance.
@@ -39,16 +61,21 @@ class LLMProviderFactory:
         Raises:
             ValueError: If the provider is not supported
         """
-        config = get_llm_config()
-        provider_name = provider_name or config["provider"]
-        provider_name = provider_name.lower()
+        # Return cached instance if available, without touching config
+        if provider_name is not None:
+            provider_name = provider_name.lower()
+            provider = cls._instances.get(provider_name)
+            if provider is not None:
+                return provider
         
-        # Return cached instance if available
-        if provider_name in cls._instances:
-            return cls._instances[provider_name]
+        config = get_llm_config()
+        provider_name = (provider_name or config["provider"]).lower()
+        provider = cls._instances.get(provider_name)
+        if provider is not None:
+            return provider
         
         # Get provider class
-        provider_class = cls._providers.get(provider_name)
+        provider_class = cls._resolve_provider_class(provider_name)
         if not provider_class:
             supported = ", ".join(cls._providers.keys())
             raise ValueError(
@@ -56,9 +83,13 @@ class LLMProviderFactory:
                 f"Supported providers: {supported}"
             )
         
-        # Create new instance
-        provider = provider_class(config)
-        cls._instances[provider_name] = provider
+        # Create new instance, re-checking under the lock so concurrent
+        # callers never build two providers
+        with cls._lock:
+            provider = cls._instances.get(provider_name)
+            if provider is None:
+                provider = provider_class(config)
+                cls._instances[provider_name] = provider
         return provider
     
     @classmethod
@@ -71,4 +102,19 @@ class LLMProviderFactory:
         Returns:
             LLMProvider: Provider instance
         """
-        return cls.create_provider(provider_name) 
\ No newline at end of file
+        return cls.create_provider(provider_name)
+    
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close and forget all cached provider instances.
+        
+        Called on application shutdown so pooled connections are released.
+        """
+        with cls._lock:
+            providers = list(cls._instances.values())
+            cls._instances.clear()
+        for provider in providers:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close provider: {str(e)}")
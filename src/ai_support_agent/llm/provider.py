@@ -1,12 +1,13 @@
 """Base provider interface for LLM providers."""
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, TypeVar, Generic
+from typing import Optional, Dict, Any, TypeVar, Generic, AsyncIterator
 
 T = TypeVar('T')
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse(Generic[T]):
     """Response from an LLM provider."""
     content: T
@@ -57,4 +58,111 @@ class LLMProvider(ABC):
         Returns:
             LLMResponse[Dict[str, Any]]: The generated JSON response
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def agenerate_text(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> LLMResponse[str]:
+        """Generate text from a prompt without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            LLMResponse[str]: The generated text response
+        """
+        pass
+    
+    @abstractmethod
+    async def agenerate_json(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> LLMResponse[Dict[str, Any]]:
+        """Generate JSON from a prompt without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            LLMResponse[Dict[str, Any]]: The generated JSON response
+        """
+        pass
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider.
+        
+        Providers without persistent connections need not override this.
+        """
+        return None
+    
+    async def stream_text(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream text from a prompt as it is generated.
+        
+        Providers without native streaming fall back to yielding the full
+        response as a single chunk.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            str: Chunks of the generated text
+        """
+        response = await self.agenerate_text(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        yield response.content
+    
+    async def stream_json(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream raw JSON text from a prompt as it is generated.
+        
+        Providers without native streaming fall back to yielding the full
+        response as a single chunk.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            str: Chunks of the JSON response text
+        """
+        response = await self.agenerate_json(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        yield json.dumps(response.content)
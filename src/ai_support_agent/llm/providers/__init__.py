@@ -1,9 +1,18 @@
 """Provider implementations package."""
 
-from .gemini import GeminiProvider
+from typing import Any
+
 from ..factory import LLMProviderFactory
 
-# Register available providers
-LLMProviderFactory.register_provider("gemini", GeminiProvider)
+# Register available providers by path; their SDKs are imported on first use
+LLMProviderFactory.register_provider("gemini", f"{__name__}.gemini:GeminiProvider")
+
+__all__ = ["GeminiProvider", "GeminiEmbedder"]
+
 
-__all__ = ["GeminiProvider"] 
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Import provider classes lazily on attribute access."""
+    if name in ("GeminiProvider", "GeminiEmbedder"):
+        from . import gemini
+        return getattr(gemini, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
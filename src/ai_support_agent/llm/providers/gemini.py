@@ -1,19 +1,47 @@
 """Gemini provider implementation."""
 
-import json
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, AsyncIterator
 
 import google.generativeai as genai
+import orjson
+from google.api_core import exceptions as google_exceptions
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from google.generativeai.types import GenerateContentResponse
 from google.generativeai.types.content import Part
 from google.generativeai.types.generation_types import GenerationConfig
 
 from ..provider import LLMProvider, LLMResponse
+from ..cache import LLMCache, InMemoryCacheBackend
+from ..semantic_cache import SemanticCache
 from ...config import get_llm_config
 
 logger = logging.getLogger(__name__)
 
+# Fixed instruction for JSON generation, placed before any request data
+JSON_INSTRUCTIONS = "Respond with valid JSON only."
+
+# Transient upstream errors worth retrying, with jittered exponential backoff
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+RETRY_ATTEMPTS = 5
+RETRY_MAX_WAIT = 16.0
+_backoff = wait_random_exponential(min=0.5, max=RETRY_MAX_WAIT)
+
+# Outermost JSON object in a response wrapped in code fences or prose
+_JSON_RE = re.compile(r"\{.*\}", re.S)
+
 
 class GeminiError(Exception):
     """Base error for Gemini operations."""
@@ -30,6 +58,76 @@ class GeminiGenerationError(GeminiError):
     pass
 
 
+@lru_cache(maxsize=32)
+def _build_generation_config(temperature: float, max_output_tokens: int) -> GenerationConfig:
+    """Validate and build a generation configuration.
+    
+    Results are shared across calls and instances, so callers must not
+    mutate the returned config.
+    
+    Args:
+        temperature: Temperature for generation
+        max_output_tokens: Maximum tokens to generate
+        
+    Returns:
+        GenerationConfig: The generation configuration
+        
+    Raises:
+        GeminiConfigError: If configuration is invalid
+    """
+    if not 0 <= temperature <= 1:
+        raise GeminiConfigError("Temperature must be between 0 and 1")
+    if max_output_tokens < 1:
+        raise GeminiConfigError("Max tokens must be positive")
+    
+    return GenerationConfig(temperature=temperature, max_output_tokens=max_output_tokens)
+
+
+def _retry_wait(retry_state: Any) -> float:
+    """Wait for the server-suggested retry delay, else back off with jitter.
+    
+    Args:
+        retry_state: The tenacity retry state
+        
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    error = retry_state.outcome.exception()
+    for detail in getattr(error, "details", None) or ():
+        delay = getattr(detail, "retry_delay", None)
+        if delay is None:
+            continue
+        if hasattr(delay, "total_seconds"):
+            seconds = delay.total_seconds()
+        else:
+            seconds = delay.seconds + delay.nanos / 1e9
+        return min(seconds, RETRY_MAX_WAIT)
+    return _backoff(retry_state)
+
+
+class GeminiEmbedder:
+    """Embedding function backed by the Gemini embeddings API."""
+    
+    def __init__(self, model: str = "models/text-embedding-004"):
+        """Initialize the embedder.
+        
+        Args:
+            model: Name of the Gemini embedding model
+        """
+        self.model = model
+    
+    def __call__(self, text: str) -> List[float]:
+        """Embed a text.
+        
+        Args:
+            text: The text to embed
+            
+        Returns:
+            List[float]: The embedding vector
+        """
+        return genai.embed_content(model=self.model, content=text)["embedding"]
+
+
 class GeminiProvider(LLMProvider):
     """Gemini provider implementation.
     
@@ -37,21 +135,49 @@ class GeminiProvider(LLMProvider):
     Gemini language model.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """Initialize the Gemini provider.
         
+        Args:
+            config: Optional LLM configuration (defaults to get_llm_config())
+            semantic_cache: Optional cache for near-duplicate JSON prompts
+            
         Raises:
             GeminiConfigError: If configuration is invalid
         """
         try:
             # Load configuration
-            self.config = get_llm_config()
+            self.config = config or get_llm_config()
             self.model = self.config["model"]
             
             # Configure Gemini
-            genai.configure(api_key=self.config["api_key"])
+            # gRPC (the SDK default) keeps one HTTP/2 channel per client, so
+            # concurrent calls on the shared provider multiplex over it
+            genai.configure(
+                api_key=self.config["api_key"],
+                transport=self.config.get("transport")
+            )
             self._model = genai.GenerativeModel(self.model)
             
+            # Bound in-flight async requests to stay under rate limits
+            self._sem = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+            
+            # Exact-match cache for deterministic responses
+            self._cache = InMemoryCacheBackend(maxsize=self.config.get("response_cache_size", 1024))
+            self._cache_ttl = self.config.get("response_cache_ttl", 1800)
+            
+            # Similarity cache for deterministic JSON prompts
+            if semantic_cache is None and self.config.get("provider_semantic_cache"):
+                semantic_cache = SemanticCache(
+                    embedder=GeminiEmbedder(),
+                    threshold=self.config.get("provider_semantic_cache_threshold", 0.92)
+                )
+            self._semantic_cache = semantic_cache
+            
             logger.info(f"Initialized Gemini provider with model: {self.model}")
             
         except Exception as e:
@@ -89,22 +215,29 @@ class GeminiProvider(LLMProvider):
         Raises:
             GeminiGenerationError: If response processing fails
         """
+        # response.text raises ValueError when the candidate was blocked
         try:
-            if not response.text:
-                raise GeminiGenerationError("Empty response from Gemini")
-            
-            text = response.text.strip()
-            if output_type == "json":
+            text = response.text
+        except ValueError as e:
+            raise GeminiGenerationError(f"Failed to process {output_type} response: {str(e)}") from e
+        
+        if not text:
+            raise GeminiGenerationError("Empty response from Gemini")
+        
+        text = text.strip()
+        if output_type == "json":
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError as e:
+                # Recover JSON wrapped in ```json fences or surrounding prose
+                match = _JSON_RE.search(text)
+                if match is None:
+                    raise GeminiGenerationError(f"Invalid JSON response: {str(e)}") from e
                 try:
-                    return json.loads(text)
-                except json.JSONDecodeError as e:
-                    raise GeminiGenerationError(f"Invalid JSON response: {str(e)}")
-            return text
-            
-        except Exception as e:
-            if isinstance(e, GeminiGenerationError):
-                raise
-            raise GeminiGenerationError(f"Failed to process {output_type} response: {str(e)}")
+                    return orjson.loads(match.group(0))
+                except orjson.JSONDecodeError:
+                    raise GeminiGenerationError(f"Invalid JSON response: {str(e)}") from e
+        return text
     
     def _create_generation_config(
         self,
@@ -123,24 +256,77 @@ class GeminiProvider(LLMProvider):
         Raises:
             GeminiConfigError: If configuration is invalid
         """
-        try:
-            config = {
-                "temperature": temperature or self.config["temperature"],
-                "max_output_tokens": max_tokens or self.config["max_tokens"]
-            }
+        return _build_generation_config(
+            temperature if temperature is not None else self.config["temperature"],
+            max_tokens if max_tokens is not None else self.config["max_tokens"]
+        )
+    
+    def _build_json_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Build a JSON prompt with its stable prefix first.
+        
+        The system prompt and JSON instructions rarely change, so placing them
+        ahead of the request data keeps the prefix identical across calls and
+        lets provider-side prefix caching apply.
+        
+        Args:
+            prompt: The request-specific prompt
+            system_prompt: Optional system prompt
             
-            # Validate configuration values
-            if not 0 <= config["temperature"] <= 1:
-                raise GeminiConfigError("Temperature must be between 0 and 1")
-            if config["max_output_tokens"] < 1:
-                raise GeminiConfigError("Max tokens must be positive")
+        Returns:
+            str: The full prompt
+        """
+        parts = [system_prompt] if system_prompt else []
+        parts.extend([JSON_INSTRUCTIONS, "---", "User data:", prompt])
+        return "\n".join(parts)
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        output_type: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Optional[str]:
+        """Build the response cache key for a request.
+        
+        Args:
+            prompt: The prompt to generate from
+            output_type: Expected output type ("text" or "json")
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
             
-            return GenerationConfig(**config)
+        Returns:
+            Optional[str]: The cache key, or None if the request is not deterministic
+        """
+        temperature = temperature if temperature is not None else self.config["temperature"]
+        if temperature != 0:
+            return None
+        return LLMCache.make_key({
+            "model": self.model,
+            "prompt": prompt,
+            "output_type": output_type,
+            "temperature": temperature,
+            "max_tokens": max_tokens if max_tokens is not None else self.config["max_tokens"]
+        })
+    
+    def _cached_response(self, key: Optional[str]) -> Optional[LLMResponse[Any]]:
+        """Get a cached response.
+        
+        Args:
+            key: The cache key, if the request is cacheable
             
-        except Exception as e:
-            if isinstance(e, GeminiConfigError):
-                raise
-            raise GeminiConfigError(f"Failed to create generation config: {str(e)}")
+        Returns:
+            Optional[LLMResponse[Any]]: The cached response with zero usage if present
+        """
+        if key is None:
+            return None
+        content = self._cache.lookup(key)
+        if content is None:
+            return None
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        )
     
     def generate_text(
         self,
@@ -163,33 +349,38 @@ class GeminiProvider(LLMProvider):
         Raises:
             GeminiGenerationError: If generation fails
         """
+        # Serve deterministic repeats from cache
+        cache_key = self._cache_key(prompt, "text", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Create generation configuration
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        # Generate response
         try:
-            # Create generation configuration
-            generation_config = self._create_generation_config(
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            
-            # Generate response
             response = self._model.generate_content(
                 prompt,
                 generation_config=generation_config
             )
-            
-            # Process response
-            content = self._handle_response(response, "text")
-            usage = self._get_token_usage(response)
-            
-            return LLMResponse(
-                content=content,
-                model=self.model,
-                usage=usage
-            )
-            
-        except Exception as e:
-            if isinstance(e, (GeminiConfigError, GeminiGenerationError)):
-                raise
-            raise GeminiGenerationError(f"Text generation failed: {str(e)}")
+        except google_exceptions.GoogleAPIError as e:
+            raise GeminiGenerationError(f"Text generation failed: {str(e)}") from e
+        
+        # Process response
+        content = self._handle_response(response, "text")
+        usage = self._get_token_usage(response)
+        if cache_key is not None:
+            self._cache.store(cache_key, content, ttl=self._cache_ttl)
+        
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage=usage
+        )
     
     def generate_json(
         self,
@@ -212,33 +403,359 @@ class GeminiProvider(LLMProvider):
         Raises:
             GeminiGenerationError: If generation fails
         """
+        # Put static instructions ahead of the request data
+        json_prompt = self._build_json_prompt(prompt, kwargs.get("system_prompt"))
+        
+        # Serve deterministic repeats from cache
+        cache_key = self._cache_key(json_prompt, "json", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Create generation configuration
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        # Generate response
         try:
-            # Add JSON instruction to prompt
-            json_prompt = f"{prompt}\nRespond with valid JSON only."
-            
-            # Create generation configuration
-            generation_config = self._create_generation_config(
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            
-            # Generate response
             response = self._model.generate_content(
                 json_prompt,
                 generation_config=generation_config
             )
+        except google_exceptions.GoogleAPIError as e:
+            raise GeminiGenerationError(f"JSON generation failed: {str(e)}") from e
+        
+        # Process response
+        content = self._handle_response(response, "json")
+        usage = self._get_token_usage(response)
+        if cache_key is not None:
+            self._cache.store(cache_key, content, ttl=self._cache_ttl)
+        
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage=usage
+        )
+    
+    async def agenerate_text(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> LLMResponse[str]:
+        """Generate text from a prompt without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            LLMResponse[str]: The generated text response
+            
+        Raises:
+            GeminiGenerationError: If generation fails
+        """
+        # Serve deterministic repeats from cache
+        cache_key = self._cache_key(prompt, "text", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Create generation configuration
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        # Generate response
+        try:
+            response = await self._generate_async(prompt, generation_config)
+        except google_exceptions.GoogleAPIError as e:
+            raise GeminiGenerationError(f"Text generation failed: {str(e)}") from e
+        
+        # Process response
+        content = self._handle_response(response, "text")
+        usage = self._get_token_usage(response)
+        if cache_key is not None:
+            self._cache.store(cache_key, content, ttl=self._cache_ttl)
+        
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage=usage
+        )
+    
+    async def agenerate_json(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> LLMResponse[Dict[str, Any]]:
+        """Generate JSON from a prompt without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters; ``semantic_scope``
+                (e.g. the compared model numbers) and ``semantic_text`` (what
+                the request is about, e.g. topic and specifications) enable the
+                semantic cache, which embeds only the text and only matches
+                requests sharing the scope
             
-            # Process response
-            content = self._handle_response(response, "json")
-            usage = self._get_token_usage(response)
+        Returns:
+            LLMResponse[Dict[str, Any]]: The generated JSON response
             
-            return LLMResponse(
-                content=content,
-                model=self.model,
-                usage=usage
+        Raises:
+            GeminiGenerationError: If generation fails
+        """
+        # Put static instructions ahead of the request data
+        json_prompt = self._build_json_prompt(prompt, kwargs.get("system_prompt"))
+        
+        # Serve deterministic repeats from cache
+        cache_key = self._cache_key(json_prompt, "json", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Fall back to a semantically similar earlier request within the caller's
+        # scope. Full prompts share their instructions and data and embed alike
+        # whatever the question, so only the caller's summary text is embedded
+        semantic_scope = kwargs.get("semantic_scope")
+        semantic_text = kwargs.get("semantic_text")
+        if semantic_scope:
+            semantic_scope = f"{self.model}|{semantic_scope}"
+        use_semantic = (
+            bool(semantic_scope and semantic_text)
+            and cache_key is not None
+            and self._semantic_cache is not None
+        )
+        if use_semantic:
+            content = await self._semantic_cache.get(semantic_scope, semantic_text)
+            if content is not None:
+                return LLMResponse(
+                    content=content,
+                    model=self.model,
+                    usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                )
+        
+        # Create generation configuration
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        # Generate response
+        try:
+            response = await self._generate_async(json_prompt, generation_config)
+        except google_exceptions.GoogleAPIError as e:
+            raise GeminiGenerationError(f"JSON generation failed: {str(e)}") from e
+        
+        # Process response
+        content = self._handle_response(response, "json")
+        usage = self._get_token_usage(response)
+        if cache_key is not None:
+            self._cache.store(cache_key, content, ttl=self._cache_ttl)
+            if use_semantic:
+                await self._semantic_cache.set(semantic_scope, semantic_text, content)
+        
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            usage=usage
+        )
+    
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        wait=_retry_wait,
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        reraise=True
+    )
+    async def _generate_async(
+        self,
+        prompt: str,
+        generation_config: GenerationConfig
+    ) -> GenerateContentResponse:
+        """Call Gemini asynchronously, retrying transient errors.
+        
+        Only the network call is retried, so cache lookups are not repeated.
+        Each attempt takes its own concurrency slot, so waiting between
+        attempts does not block other requests.
+        
+        Args:
+            prompt: The full prompt to send
+            generation_config: The generation configuration
+            
+        Returns:
+            GenerateContentResponse: The Gemini response
+        """
+        async with self._sem:
+            return await self._model.generate_content_async(
+                prompt,
+                generation_config=generation_config
             )
+    
+    async def _stream_content(
+        self,
+        prompt: str,
+        generation_config: GenerationConfig,
+        kind: str
+    ) -> AsyncIterator[str]:
+        """Stream response text chunks from Gemini.
+        
+        The concurrency slot is held until the stream is exhausted.
+        
+        Args:
+            prompt: The full prompt to send
+            generation_config: The generation configuration
+            kind: Output kind used in error messages ("Text" or "JSON")
             
-        except Exception as e:
-            if isinstance(e, (GeminiConfigError, GeminiGenerationError)):
-                raise
-            raise GeminiGenerationError(f"JSON generation failed: {str(e)}") 
\ No newline at end of file
+        Yields:
+            str: Non-empty text chunks
+            
+        Raises:
+            GeminiGenerationError: If streaming fails
+        """
+        try:
+            async with self._sem:
+                response = await self._model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    stream=True
+                )
+                async for chunk in response:
+                    if chunk.text:
+                        yield chunk.text
+        except google_exceptions.GoogleAPIError as e:
+            raise GeminiGenerationError(f"{kind} streaming failed: {str(e)}") from e
+        except ValueError as e:
+            # chunk.text raises ValueError when the candidate was blocked
+            raise GeminiGenerationError(f"{kind} streaming failed: {str(e)}") from e
+    
+    async def stream_text(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream text from a prompt as it is generated.
+        
+        Cached responses are emitted as a single chunk.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            str: Chunks of the generated text
+            
+        Raises:
+            GeminiGenerationError: If generation fails
+        """
+        cache_key = self._cache_key(prompt, "text", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            yield cached.content
+            return
+        
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        parts: List[str] = []
+        async for text in self._stream_content(prompt, generation_config, "Text"):
+            parts.append(text)
+            yield text
+        
+        if cache_key is not None and parts:
+            self._cache.store(cache_key, "".join(parts).strip(), ttl=self._cache_ttl)
+    
+    async def stream_json(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream raw JSON text from a prompt as it is generated.
+        
+        Cached responses are emitted as a single chunk. The streamed text is
+        only cached once it parses as JSON.
+        
+        Args:
+            prompt: The prompt to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            str: Chunks of the JSON response text
+            
+        Raises:
+            GeminiGenerationError: If generation fails
+        """
+        json_prompt = self._build_json_prompt(prompt, kwargs.get("system_prompt"))
+        
+        cache_key = self._cache_key(json_prompt, "json", temperature, max_tokens)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            yield orjson.dumps(cached.content).decode()
+            return
+        
+        generation_config = self._create_generation_config(
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        parts: List[str] = []
+        async for text in self._stream_content(json_prompt, generation_config, "JSON"):
+            parts.append(text)
+            yield text
+        
+        if cache_key is not None:
+            try:
+                content = orjson.loads("".join(parts))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Streamed JSON response is invalid, not caching: {str(e)}")
+            else:
+                self._cache.store(cache_key, content, ttl=self._cache_ttl)
+    
+    async def agenerate_json_batch(
+        self,
+        prompts: List[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> List[LLMResponse[Dict[str, Any]]]:
+        """Generate JSON for several prompts concurrently.
+        
+        The google-generativeai SDK has no batch endpoint, so requests are
+        issued concurrently (bounded by max_concurrency) and share the
+        response caches.
+        
+        Args:
+            prompts: The prompts to generate from
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            List[LLMResponse[Dict[str, Any]]]: The responses, in prompt order
+            
+        Raises:
+            GeminiGenerationError: If any generation fails
+        """
+        return list(await asyncio.gather(*(
+            self.agenerate_json(prompt, temperature=temperature, max_tokens=max_tokens, **kwargs)
+            for prompt in prompts
+        )))
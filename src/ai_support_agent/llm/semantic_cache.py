@@ -0,0 +1,158 @@
+"""Semantic caching for near-duplicate LLM requests."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
+
+# NumPy is imported on first use; the cache is off by default and llm re-exports it
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a small sentence-transformers model.
+
+    The model is loaded on first use. Requires the optional
+    ``sentence-transformers`` package.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        """Initialize the embedder.
+
+        Args:
+            model_name: Name of the sentence-transformers model
+        """
+        self.model_name = model_name
+        self._model = None
+
+    def __call__(self, text: str) -> Sequence[float]:
+        """Embed a text.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            Sequence[float]: The embedding vector
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "SentenceTransformerEmbedder requires the 'sentence-transformers' package"
+                ) from e
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text)
+
+
+class SemanticCache:
+    """Cache that matches requests by embedding similarity.
+
+    Entries are partitioned by an exact scope (e.g. the set of model numbers),
+    so only the free-text part of a request is matched semantically.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        threshold: float = 0.95,
+        maxsize: int = 512
+    ):
+        """Initialize the cache.
+
+        Args:
+            embedder: Optional embedding function (defaults to sentence-transformers)
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum number of entries to keep
+        """
+        self.embedder = embedder or SentenceTransformerEmbedder()
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[np.ndarray, Dict[str, Any]]]" = OrderedDict()
+
+    async def _embed(self, text: str) -> "np.ndarray":
+        """Embed and L2-normalize a text off the event loop."""
+        import numpy as np
+
+        vector = np.asarray(await asyncio.to_thread(self.embedder, text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def get(self, scope: str, text: str) -> Optional[Dict[str, Any]]:
+        """Get the cached value most similar to a text within a scope.
+
+        Args:
+            scope: Exact-match partition key
+            text: Text to match semantically
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value if similar enough
+        """
+        if not any(key[0] == scope for key in self._entries):
+            self.misses += 1
+            return None
+
+        try:
+            vector = await self._embed(text)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            self.misses += 1
+            return None
+
+        # Snapshot after embedding; a concurrent set() may have evicted entries meanwhile
+        entries = [(key, entry) for key, entry in self._entries.items() if key[0] == scope]
+        if not entries:
+            self.misses += 1
+            return None
+
+        import numpy as np
+
+        matrix = np.stack([entry[0] for _, entry in entries])
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        key, (_, value) = entries[best]
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, scope: str, text: str, value: Dict[str, Any]) -> None:
+        """Store a value.
+
+        Args:
+            scope: Exact-match partition key
+            text: Text the value was generated for
+            value: The value to store
+        """
+        try:
+            vector = await self._embed(text)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {str(e)}")
+            return
+
+        key = (scope, text)
+        self._entries[key] = (vector, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters.
+
+        Returns:
+            Dict[str, int]: Cache statistics
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -1,16 +1,24 @@
 """Main application module for the AI Support Agent."""
 import os
+import re
+import sys
 from contextlib import asynccontextmanager
 from typing import Any
 
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config.config import get_config, ensure_directories_exist
 from .api.routes import router as api_router
+from .llm.factory import LLMProviderFactory
+from .tools.pdf_processor import PDFProcessor
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +26,75 @@ load_dotenv()
 # Get configuration
 config = get_config()
 
+# Build tools emit content-hashed file names (e.g. app.3f2a9c1b.js)
+_HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.")
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with browser caching headers.
+    
+    Content-hashed assets are cached indefinitely; everything else must be
+    revalidated, which Starlette answers with a 304 via the ETag it sets.
+    """
+    
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200
+    ) -> Response:
+        """Create the file response and add a Cache-Control header.
+        
+        Args:
+            full_path: Path of the file on disk
+            stat_result: Result of stat() on the file
+            scope: The ASGI scope
+            status_code: HTTP status code
+            
+        Returns:
+            Response: The file (or 304 Not Modified) response
+        """
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _HASHED_ASSET_RE.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves streaming endpoints uncompressed.
+    
+    Starlette's gzip responder buffers streamed bodies in the compressor
+    without flushing, which would hold back incremental NDJSON output.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        exclude_paths: frozenset[str] = frozenset()
+    ) -> None:
+        """Initialize the middleware.
+        
+        Args:
+            app: The wrapped application
+            minimum_size: Smallest response body to compress, in bytes
+            compresslevel: Gzip compression level
+            exclude_paths: Request paths whose responses are never compressed
+        """
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = exclude_paths
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, bypassing compression for excluded paths."""
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> Any:
     """Handle application startup and shutdown events.
@@ -38,13 +115,16 @@ async def lifespan(app: FastAPI) -> Any:
     
     # Shutdown
     print("Shutting down AI Support Agent")
+    await LLMProviderFactory.aclose_all()
+    PDFProcessor.shutdown_executor()
 
 # Create FastAPI app
 app = FastAPI(
     title="AI Support Agent",
     description="AI-driven customer support system for product information and comparison",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -61,24 +141,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads such as multi-model comparisons; the
+# NDJSON analysis stream must reach clients as it is produced
+app.add_middleware(
+    StreamingAwareGZipMiddleware,
+    minimum_size=1024,
+    exclude_paths=frozenset({"/api/analyze/stream"})
+)
+
 # Add routers
 app.include_router(api_router)
 
 # Serve static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 
 @app.get("/")
-async def root() -> JSONResponse:
+async def root() -> ORJSONResponse:
     """Root endpoint to verify the API is running.
     
     Returns:
-        JSONResponse: Response with status message
+        ORJSONResponse: Response with status message
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={"message": "AI Support Agent API is running"},
         status_code=200
     )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # uvloop is unavailable on Windows; multiple workers need an import string
+    uvicorn.run(
+        "ai_support_agent.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    ) 
\ No newline at end of file
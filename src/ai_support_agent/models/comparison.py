@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 
 from .pdf import Specification
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Feature:
     """Feature model.
     
@@ -17,7 +17,7 @@ class Feature:
     text: str
     models: Dict[str, bool]
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonSpecification:
     """Comparison specification model.
     
@@ -27,16 +27,27 @@ class ComparisonSpecification:
         category: Category within section (e.g., 'Voltage')
         specification: Specification name (e.g., 'Switching')
         values: Model numbers to their values
-        has_differences: Whether values differ between models
+        has_differences: Whether values or units differ between models,
+            derived from values on construction
         analysis: Optional analysis data
     """
     category: str
     specification: str
     values: Dict[str, Specification]
-    has_differences: bool
+    has_differences: bool = field(init=False)
     analysis: Optional[Dict[str, Any]] = None
 
-@dataclass
+    def __post_init__(self):
+        """Derive has_differences from the values."""
+        specs = iter(self.values.values())
+        first = next(specs, None)
+        if first is None:
+            self.has_differences = False
+            return
+        key = (first.value, first.unit)
+        self.has_differences = any((spec.value, spec.unit) != key for spec in specs)
+
+@dataclass(slots=True)
 class ComparisonSection:
     """Comparison section model.
     
@@ -47,7 +58,7 @@ class ComparisonSection:
     """
     categories: Dict[str, List[ComparisonSpecification]] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResponse:
     """Comparison response model.
     
@@ -1,6 +1,8 @@
 """Data models for differences and analysis."""
+import sys
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 class DifferenceError(Exception):
@@ -13,7 +15,8 @@ class ValidationError(DifferenceError):
     pass
 
 
-@dataclass
+# Not slotted: prompt_fragment is a cached_property and needs __dict__
+@dataclass(frozen=True)
 class Difference:
     """Model representing a difference between specifications.
     
@@ -46,6 +49,39 @@ class Difference:
             raise ValidationError("Difference description is required")
         if not self.values:
             raise ValidationError("Values dictionary is required")
+        
+        # Model numbers, categories and units repeat across differences
+        object.__setattr__(self, "model", sys.intern(self.model))
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "subcategory", sys.intern(self.subcategory))
+        if self.unit:
+            object.__setattr__(self, "unit", sys.intern(self.unit))
+    
+    @cached_property
+    def prompt_fragment(self) -> str:
+        """Render the difference as an LLM prompt block.
+        
+        The rendering is computed once per instance, so re-analyzing the same
+        comparison with a different intent reuses it.
+        
+        Returns:
+            str: The formatted difference with its per-model values
+        """
+        unit_suffix = f" {self.unit}" if self.unit else ""
+        unit_note = f" ({self.unit})" if self.unit else ""
+        # Category-only specifications have no subcategory
+        path = " > ".join(name for name in (self.category, self.subcategory, self.specification) if name)
+        parts = [
+            f"- {path}:\n",
+            f"  {self.difference}{unit_note}\n",
+            "  Values by model:\n"
+        ]
+        parts.extend(
+            f"    - {model}: {value}{unit_suffix}\n"
+            for model, value in self.values.items()
+        )
+        parts.append("\n")
+        return "".join(parts)
             
     @classmethod
     def create(
@@ -86,7 +122,7 @@ class Difference:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Analysis:
     """Model representing an analysis of differences.
     
@@ -1,8 +1,9 @@
 """Data models for PDF processing."""
-from typing import Dict, List, Optional, Any
+import sys
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Specification:
     """Specification model.
     
@@ -18,10 +19,13 @@ class Specification:
     display_value: Optional[str] = None
 
     def __post_init__(self):
+        # Units repeat across every document, so share one string per unit
+        if self.unit:
+            object.__setattr__(self, "unit", sys.intern(self.unit))
         if self.display_value is None:
-            self.display_value = self.value
+            object.__setattr__(self, "display_value", self.value)
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Category model.
     
@@ -34,11 +38,15 @@ class Category:
     name: str
     subcategories: Dict[str, Specification] = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Intern the name, which repeats across documents."""
+        self.name = sys.intern(self.name)
+
     def add_specification(self, name: str, specification: Specification) -> None:
         """Add a specification to the category."""
         self.subcategories[name] = specification
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Section model.
     
@@ -51,13 +59,17 @@ class Section:
     name: str
     categories: Dict[str, Category] = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Intern the name, which repeats across documents."""
+        self.name = sys.intern(self.name)
+
     def add_category(self, name: str) -> Category:
         """Add a category to the section if it doesn't exist."""
         if name not in self.categories:
             self.categories[name] = Category(name=name)
         return self.categories[name]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Page:
     """Page model.
     
@@ -70,7 +82,7 @@ class Page:
     page_number: int
     raw_text: str
 
-@dataclass
+@dataclass(slots=True)
 class PDFContent:
     """PDF content model.
     
@@ -88,6 +100,9 @@ class PDFContent:
     raw_text: str = ""
     pages: List[Page] = field(default_factory=list)
     sections: Dict[str, Section] = field(default_factory=dict)
+    _flat: Dict[Tuple[str, str, str], Specification] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def add_page(self, page_number: int, raw_text: str) -> Page:
         """Add a page to the PDF content."""
@@ -101,6 +116,37 @@ class PDFContent:
             self.sections[name] = Section(name=name)
         return self.sections[name]
 
+    def add_specification(
+        self,
+        section_name: str,
+        category_name: str,
+        specification_name: str,
+        specification: Specification
+    ) -> Specification:
+        """Add a specification, creating its section and category as needed.
+        
+        The flat lookup index is updated at the same time, so specifications
+        should be added through this method rather than the nested models.
+        
+        Args:
+            section_name: The section name
+            category_name: The category name
+            specification_name: The specification name
+            specification: The specification to add
+            
+        Returns:
+            Specification: The added specification
+        """
+        self.add_section(section_name).add_category(category_name).add_specification(
+            specification_name, specification
+        )
+        self._flat[(section_name, category_name, specification_name)] = specification
+        return specification
+
+    def specifications(self) -> Dict[Tuple[str, str, str], Specification]:
+        """Get every specification keyed by (section, category, specification) name."""
+        return self._flat
+
     def get_specification(self, section_name: str, category_name: str, specification_name: str) -> Optional[Specification]:
         """Get a specification by section, category, and name.
         
@@ -115,15 +161,12 @@ class PDFContent:
         Raises:
             KeyError: If the section, category, or specification is not found
         """
+        spec = self._flat.get((section_name, category_name, specification_name))
+        if spec is not None:
+            return spec
+        
         if section_name not in self.sections:
             raise KeyError(f"Section '{section_name}' not found")
-        
-        section = self.sections[section_name]
-        if category_name not in section.categories:
+        if category_name not in self.sections[section_name].categories:
             raise KeyError(f"Category '{category_name}' not found in section '{section_name}'")
-        
-        category = section.categories[category_name]
-        if specification_name not in category.subcategories:
-            raise KeyError(f"Specification '{specification_name}' not found in category '{category_name}'")
-        
-        return category.subcategories[specification_name] 
\ No newline at end of file
+        raise KeyError(f"Specification '{specification_name}' not found in category '{category_name}'")
@@ -1,6 +1,7 @@
 """Unit transformation and standardization tools."""
 
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import NamedTuple, Optional, Any
 
 # Unit types
 UNIT_TYPES = {
@@ -84,6 +85,27 @@ STANDARD_UNITS = {
     "AMPERE TURNS": {"symbol": "AT", "display": "AT", "type": UNIT_TYPES["magnetic"]}
 }
 
+
+
+class UnitInfo(NamedTuple):
+    """Standardized unit.
+    
+    Attributes:
+        symbol: Canonical unit symbol
+        display: Display form, including any standardized suffix
+        type: Unit type from UNIT_TYPES
+    """
+    symbol: str
+    display: str
+    type: str
+
+
+# Immutable lookup tables built from STANDARD_UNITS
+_STANDARD_UNITS = {key: UnitInfo(**value) for key, value in STANDARD_UNITS.items()}
+
+# Case-insensitive view; keys differing only in case map to equal entries
+_STANDARD_UNITS_CI = {key.lower(): value for key, value in _STANDARD_UNITS.items()}
+
 # Standard suffixes
 STANDARD_SUFFIXES = {
     "maximum": "max",
@@ -93,14 +115,15 @@ STANDARD_SUFFIXES = {
 }
 
 
-def standardize_unit(unit: Optional[str]) -> Optional[Dict[str, str]]:
+@lru_cache(maxsize=1024)
+def standardize_unit(unit: Optional[str]) -> Optional[UnitInfo]:
     """Standardize a unit string to its canonical form.
     
     Args:
         unit: Unit string to standardize
         
     Returns:
-        Dict with standardized unit info or None if not found
+        Standardized unit info or None if not found
     """
     if not unit:
         return None
@@ -111,16 +134,11 @@ def standardize_unit(unit: Optional[str]) -> Optional[Dict[str, str]]:
     suffix = parts[1].strip() if len(parts) > 1 else None
         
     # Step 2: Try direct lookup
-    if base_unit in STANDARD_UNITS:
-        std_unit = STANDARD_UNITS[base_unit]
+    if base_unit in _STANDARD_UNITS:
+        std_unit = _STANDARD_UNITS[base_unit]
     else:
         # Try case-insensitive lookup
-        base_unit_lower = base_unit.lower()
-        std_unit = None
-        for key, value in STANDARD_UNITS.items():
-            if key.lower() == base_unit_lower:
-                std_unit = value
-                break
+        std_unit = _STANDARD_UNITS_CI.get(base_unit.lower())
                 
     if not std_unit:
         return None
@@ -131,14 +149,15 @@ def standardize_unit(unit: Optional[str]) -> Optional[Dict[str, str]]:
         # Always abbreviate standard suffixes
         if suffix_lower in STANDARD_SUFFIXES:
             abbrev = STANDARD_SUFFIXES[suffix_lower]
-            std_unit = {**std_unit, "display": f"{std_unit['display']} - {abbrev}"}
+            std_unit = std_unit._replace(display=f"{std_unit.display} - {abbrev}")
         else:
             # For any other suffix, keep it as is
-            std_unit = {**std_unit, "display": f"{std_unit['display']} - {suffix}"}
+            std_unit = std_unit._replace(display=f"{std_unit.display} - {suffix}")
             
     return std_unit
 
 
+@lru_cache(maxsize=1024)
 def format_display_value(value: str, unit: Optional[str] = None) -> str:
     """Format a value with its unit for display.
     
@@ -161,4 +180,4 @@ def format_display_value(value: str, unit: Optional[str] = None) -> str:
     if not std_unit:
         return f"{value} {unit}"
         
-    return f"{value} {std_unit['display']}" 
\ No newline at end of file
+    return f"{value} {std_unit.display}" 
\ No newline at end of file
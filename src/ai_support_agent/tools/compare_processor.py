@@ -1,7 +1,12 @@
 """Service for comparing PDF specifications."""
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import OrderedDict, defaultdict
+from sys import intern
+import asyncio
 import logging
 
+import numpy as np
+
 from ..models.pdf import PDFContent, Specification
 from ..models.comparison import (
     Feature, ComparisonSpecification, ComparisonSection,
@@ -9,10 +14,29 @@ from ..models.comparison import (
 )
 from ..models.differences import Difference
 from .pdf_processor import PDFProcessor
-from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Below this many values, NumPy's call overhead outweighs its vectorized reductions
+_VECTORIZE_MIN_VALUES = 16
+
+# Parsed documents kept in memory by each processor
+_CONTENT_CACHE_SIZE = 128
+
+# Sections handled separately from specification comparison
+_SKIP_SECTIONS: frozenset[str] = frozenset({"Features_And_Advantages", "Diagram"})
+
+
+def _try_float(value: str) -> Optional[float]:
+    """Parse a plain non-negative decimal, returning None for anything else."""
+    if not value.replace('.', '', 1).isdigit():
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        # isdigit() also accepts characters such as superscripts
+        return None
+
 
 class CompareProcessor:
     """Service for comparing PDF specifications.
@@ -28,7 +52,17 @@ class CompareProcessor:
             pdf_processor: Optional PDF processor to use
         """
         self.pdf_processor = pdf_processor or PDFProcessor()
-        self.config = get_config()
+        
+        # Parsed content by model number with the file version it was read from,
+        # shared across comparisons and kept in least-recently-used order
+        self._content_cache: "OrderedDict[str, Tuple[Optional[Tuple[str, int, int]], PDFContent]]" = OrderedDict()
+        # Locks for loads in progress only, with the number of callers holding
+        # or waiting on each so a lock is dropped only once nobody needs it
+        self._content_locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+        
+        # Flattened specifications by model number, with the content they came from
+        self._flat_cache: Dict[str, Tuple[PDFContent, Dict[Tuple[str, str, str], Specification]]] = {}
     
     async def compare_models(
         self,
@@ -42,6 +76,43 @@ class CompareProcessor:
         Returns:
             ComparisonResponse: The comparison results
             
+        Raises:
+            ValueError: If comparison fails
+        """
+        comparison, _ = await self._compare(model_numbers)
+        return comparison
+    
+    async def find_differences(
+        self,
+        model_numbers: List[str]
+    ) -> List[Difference]:
+        """Find the specifications that differ between multiple models.
+        
+        Args:
+            model_numbers: List of model numbers to compare
+            
+        Returns:
+            List[Difference]: The differences found
+            
+        Raises:
+            ValueError: If comparison fails
+        """
+        _, differences = await self._compare(model_numbers)
+        return differences
+    
+    async def _compare(
+        self,
+        model_numbers: List[str]
+    ) -> Tuple[ComparisonResponse, List[Difference]]:
+        """Compare models and collect their differences.
+        
+        Args:
+            model_numbers: List of model numbers to compare
+            
+        Returns:
+            Tuple[ComparisonResponse, List[Difference]]: The comparison results
+            and the differences behind its count
+            
         Raises:
             ValueError: If comparison fails
         """
@@ -49,14 +120,10 @@ class CompareProcessor:
             # Collect model data
             models = await self._collect_model_data(model_numbers)
             if not models:
-                return ComparisonResponse(model_numbers=model_numbers)
-            
-            # Process features and advantages
-            features = self._process_features(models, model_numbers)
-            advantages = self._process_advantages(models, model_numbers)
+                return ComparisonResponse(model_numbers=model_numbers), []
             
-            # Process specifications and differences
-            sections, differences = self._process_specifications(models, model_numbers)
+            # Process features, advantages, specifications and differences
+            features, advantages, sections, differences = self._process_all(models, model_numbers)
             
             # Create response with unified sections structure
             response_sections: Dict[str, ComparisonSection] = {}
@@ -76,11 +143,12 @@ class CompareProcessor:
             # Add specification sections
             response_sections.update(sections)
             
-            return ComparisonResponse(
+            comparison = ComparisonResponse(
                 model_numbers=model_numbers,
                 sections=response_sections,
                 differences_count=len(differences)
             )
+            return comparison, differences
             
         except Exception as e:
             logger.error(f"Failed to compare models: {str(e)}")
@@ -98,238 +166,276 @@ class CompareProcessor:
         Returns:
             Dict[str, PDFContent]: Model numbers to their content
         """
+        # Fetch all models concurrently; a failure only drops that model
+        results = await asyncio.gather(
+            *(self._get_content(number) for number in model_numbers),
+            return_exceptions=True
+        )
+        
         models = {}
-        for number in model_numbers:
-            try:
-                content = await self.pdf_processor.get_content(number)
-                models[number] = content
-            except Exception as e:
-                logger.warning(f"Failed to get content for model {number}: {str(e)}")
+        for number, result in zip(model_numbers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to get content for model {number}: {str(result)}")
+                continue
+            models[number] = result
         return models
     
-    def _process_features(
+    async def _get_content(self, model_number: str) -> PDFContent:
+        """Get PDF content for a model, parsing it at most once per file version.
+        
+        Cached content is reused only while the backing file is unchanged.
+        Concurrent requests for the same model wait on a per-model lock so
+        only the first one parses the PDF.
+        
+        Args:
+            model_number: The model number
+            
+        Returns:
+            PDFContent: The model's content
+        """
+        version = self.pdf_processor.pdf_version(model_number)
+        if (content := self._cached_content(model_number, version)) is not None:
+            return content
+        
+        lock = self._content_locks.setdefault(model_number, asyncio.Lock())
+        self._lock_users[model_number] = self._lock_users.get(model_number, 0) + 1
+        try:
+            async with lock:
+                content = self._cached_content(model_number, version)
+                if content is None:
+                    content = await self.pdf_processor.get_content(model_number)
+                    self._store_content(model_number, version, content)
+        finally:
+            # lock.locked() clears before the next waiter resumes, so count users
+            # instead; later requests are served from the cache
+            self._lock_users[model_number] -= 1
+            if not self._lock_users[model_number]:
+                del self._lock_users[model_number]
+                del self._content_locks[model_number]
+        return content
+    
+    def _cached_content(
         self,
-        models: Dict[str, PDFContent],
-        model_numbers: List[str]
-    ) -> List[Feature]:
-        """Process features from all models.
+        model_number: str,
+        version: Optional[Tuple[str, int, int]]
+    ) -> Optional[PDFContent]:
+        """Get cached content if it was read from the given file version.
         
         Args:
-            models: Dictionary of model numbers to their content
-            model_numbers: List of model numbers to process
+            model_number: The model number
+            version: The current file version
             
         Returns:
-            List[Feature]: The processed features
+            Optional[PDFContent]: The cached content if still current
         """
-        return self._process_feature_type(models, model_numbers, "features")
+        cached = self._content_cache.get(model_number)
+        if cached is None or cached[0] != version:
+            return None
+        self._content_cache.move_to_end(model_number)
+        return cached[1]
     
-    def _process_advantages(
+    def _store_content(
         self,
-        models: Dict[str, PDFContent],
-        model_numbers: List[str]
-    ) -> List[Feature]:
-        """Process advantages from all models.
+        model_number: str,
+        version: Optional[Tuple[str, int, int]],
+        content: PDFContent
+    ) -> None:
+        """Cache content, evicting the least recently used models when full.
         
         Args:
-            models: Dictionary of model numbers to their content
-            model_numbers: List of model numbers to process
+            model_number: The model number
+            version: The file version the content was read from
+            content: The parsed content
+        """
+        self._content_cache[model_number] = (version, content)
+        self._content_cache.move_to_end(model_number)
+        while len(self._content_cache) > _CONTENT_CACHE_SIZE:
+            evicted, _ = self._content_cache.popitem(last=False)
+            self._flat_cache.pop(evicted, None)
+    
+    def _flat_specs(
+        self,
+        model_number: str,
+        content: PDFContent
+    ) -> Dict[Tuple[str, str, str], Specification]:
+        """Get a model's comparable specifications as a flat dict, built once.
+        
+        Keys are interned (section, category, specification) names; sections
+        in _SKIP_SECTIONS are left out.
+        
+        Args:
+            model_number: The model number
+            content: The model's content
             
         Returns:
-            List[Feature]: The processed advantages
+            Dict[Tuple[str, str, str], Specification]: The flattened specifications
         """
-        return self._process_feature_type(models, model_numbers, "advantages")
+        if (cached := self._flat_cache.get(model_number)) is not None and cached[0] is content:
+            return cached[1]
+        
+        # Names repeat across models; interned keys compare by identity
+        flat = {
+            (intern(section_name), intern(category_name), intern(spec_name)): spec
+            for (section_name, category_name, spec_name), spec in content.specifications().items()
+            if section_name not in _SKIP_SECTIONS
+        }
+        self._flat_cache[model_number] = (content, flat)
+        return flat
     
-    def _process_feature_type(
+    def _process_all(
         self,
         models: Dict[str, PDFContent],
-        model_numbers: List[str],
-        feature_type: str
-    ) -> List[Feature]:
-        """Process a specific type of feature from all models.
+        model_numbers: List[str]
+    ) -> Tuple[List[Feature], List[Feature], Dict[str, ComparisonSection], List[Difference]]:
+        """Process features, advantages and specifications in one traversal.
         
         Args:
             models: Dictionary of model numbers to their content
             model_numbers: List of model numbers to process
-            feature_type: Type of feature to process
             
         Returns:
-            List[Feature]: The processed features
+            Tuple containing:
+            - List of features
+            - List of advantages
+            - Dictionary of section name to comparison section
+            - List of differences found
         """
-        all_features = set()
-        feature_models: Dict[str, Dict[str, bool]] = {}
+        # Feature text to the models offering it, insertion-ordered so
+        # features keep the order the documents list them in
+        feature_models: Dict[str, Dict[str, Set[str]]] = {"features": {}, "advantages": {}}
+        sections: Dict[str, ComparisonSection] = {}
+        combo_values: Dict[Tuple[str, str, str], Dict[str, Specification]] = defaultdict(dict)
         
         for name in model_numbers:
-            if name not in models:
-                continue
-                
-            model = models[name]
-            if "Features_And_Advantages" not in model.sections:
+            if (model := models.get(name)) is None:
                 continue
-                
-            section = model.sections["Features_And_Advantages"]
-            if feature_type not in section.categories:
-                continue
-                
-            category = section.categories[feature_type]
-            if not category.subcategories:
-                continue
-                
-            # Get feature text
-            spec = category.subcategories.get("")
-            if not spec:
-                continue
-                
-            # Split into individual features
-            features = spec.value.split("\n")
             
-            # Record each feature
-            for feature in features:
-                feature = feature.strip()
-                if not feature:
-                    continue
+            name = intern(name)
+            if (section := model.sections.get("Features_And_Advantages")) is not None:
+                for feature_type, found in feature_models.items():
+                    if (category := section.categories.get(feature_type)) is None:
+                        continue
+                    if not (spec := category.subcategories.get("")):
+                        continue
                     
-                all_features.add(feature)
-                if feature not in feature_models:
-                    feature_models[feature] = {}
-                feature_models[feature][name] = True
+                    # Record each non-blank line as a feature
+                    for line in map(str.strip, spec.value.splitlines()):
+                        if line:
+                            found.setdefault(line, set()).add(name)
+            
+            for combination, spec in self._flat_specs(name, model).items():
+                combo_values[combination][name] = spec
         
-        # Create Feature objects
+        features = self._build_features(feature_models["features"], model_numbers)
+        advantages = self._build_features(feature_models["advantages"], model_numbers)
+        # A single model cannot differ from anything
+        differences = self._process_specifications(
+            combo_values,
+            sections,
+            detect_differences=len(models) > 1
+        )
+        return features, advantages, sections, differences
+    
+    def _build_features(
+        self,
+        feature_models: Dict[str, Set[str]],
+        model_numbers: List[str]
+    ) -> List[Feature]:
+        """Create Feature objects from collected feature text.
+        
+        Args:
+            feature_models: Feature text to the models offering it
+            model_numbers: List of model numbers to report on
+            
+        Returns:
+            List[Feature]: The processed features
+        """
         return [
             Feature(
                 text=feature,
-                models={
-                    name: feature_models.get(feature, {}).get(name, False)
-                    for name in model_numbers
-                }
+                models={name: name in present for name in model_numbers}
             )
-            for feature in sorted(all_features)
+            for feature, present in feature_models.items()
         ]
     
     def _process_specifications(
         self,
-        models: Dict[str, PDFContent],
-        model_numbers: List[str]
-    ) -> Tuple[Dict[str, ComparisonSection], List[Difference]]:
-        """Process specifications from all models.
+        combo_values: Dict[Tuple[str, str, str], Dict[str, Specification]],
+        sections: Dict[str, ComparisonSection],
+        detect_differences: bool = True
+    ) -> List[Difference]:
+        """Build comparison specifications and differences.
         
         Args:
-            models: Dictionary of model numbers to their content
-            model_numbers: List of model numbers to process
+            combo_values: Section/category/spec combination to per-model values
+            sections: Comparison sections to add the specifications to
+            detect_differences: Whether to look for differences at all
             
         Returns:
-            Tuple containing:
-            - Dictionary of section name to comparison section
-            - List of differences found
+            List[Difference]: The differences found
         """
-        sections: Dict[str, ComparisonSection] = {}
         differences: List[Difference] = []
-        
-        # First collect all unique section/category combinations
-        spec_combinations = []
-        seen_combinations = set()
-        
-        # Process regular sections first
-        for name in model_numbers:
-            if name not in models:
-                continue
-                
-            model = models[name]
-            for section_name, section in model.sections.items():
-                if section_name in ["Features_And_Advantages", "Diagram"]:
-                    continue
-                    
-                # Initialize section if not exists
-                if section_name not in sections:
-                    sections[section_name] = ComparisonSection()
-                    
-                for category_name, category in section.categories.items():
-                    for spec_name in category.subcategories.keys():
-                        combination = (section_name, category_name, spec_name)
-                        if combination not in seen_combinations:
-                            spec_combinations.append(combination)
-                            seen_combinations.add(combination)
+        add_difference = differences.append
         
         # Now process each combination
-        for section_name, category_name, spec_name in spec_combinations:
-            values: Dict[str, Specification] = {}
-            has_differences = False
-            
-            # Collect values from each model
-            for name in model_numbers:
-                if name not in models:
-                    continue
-                    
-                model = models[name]
-                if section_name not in model.sections:
-                    continue
-                    
-                section = model.sections[section_name]
-                if category_name not in section.categories:
-                    continue
-                    
-                category = section.categories[category_name]
-                if spec_name not in category.subcategories:
-                    continue
-                    
-                spec = category.subcategories[spec_name]
-                values[name] = spec
-            
-            # Skip if no values found
-            if not values:
-                continue
-                
-            # Check for differences
-            if len(values) > 1:
-                value_set = {
-                    (spec.value, spec.unit) for spec in values.values()
-                }
-                has_differences = len(value_set) > 1
-            
+        for (section_name, category_name, spec_name), values in combo_values.items():
             # Create comparison specification
             comparison = ComparisonSpecification(
                 category=category_name,
                 specification=spec_name,
-                values=values,
-                has_differences=has_differences
+                values=values
             )
             
-            # Add to section
-            if category_name not in sections[section_name].categories:
-                sections[section_name].categories[category_name] = []
-            sections[section_name].categories[category_name].append(comparison)
+            # Add to section; unlike setdefault, only allocates a list for new categories
+            if (section := sections.get(section_name)) is None:
+                section = sections[section_name] = ComparisonSection()
+            categories = section.categories
+            if (bucket := categories.get(category_name)) is None:
+                bucket = categories[category_name] = []
+            bucket.append(comparison)
             
             # Record difference if found
-            if has_differences:
-                # Get the model with the most different value
-                all_values = [
-                    float(v.value) if v.value.replace('.','',1).isdigit() else v.value
-                    for v in values.values()
+            if detect_differences and comparison.has_differences:
+                # Get the model with the most different value, parsing each value once
+                value_str_map = {model_name: spec.value for model_name, spec in values.items()}
+                parsed = [
+                    (model_name, _try_float(value))
+                    for model_name, value in value_str_map.items()
                 ]
                 
-                if all(isinstance(v, (int, float)) for v in all_values):
+                if all(number is not None for _, number in parsed):
                     # For numeric values, find model with most extreme value
-                    extreme_model = max(
-                        values.items(),
-                        key=lambda x: abs(float(x[1].value))
-                    )[0]
-                    difference_desc = f"Value of {max(all_values)} vs {min(all_values)}"
+                    if len(parsed) >= _VECTORIZE_MIN_VALUES:
+                        numbers = np.fromiter(
+                            (number for _, number in parsed),
+                            dtype=np.float64,
+                            count=len(parsed)
+                        )
+                        extreme_model = parsed[int(np.argmax(np.abs(numbers)))][0]
+                        high, low = float(numbers.max()), float(numbers.min())
+                    else:
+                        extreme_model = max(parsed, key=lambda item: abs(item[1]))[0]
+                        numbers = [number for _, number in parsed]
+                        high, low = max(numbers), min(numbers)
+                    difference_desc = f"Value of {high} vs {low}"
                 else:
                     # For non-numeric values, take first model
-                    extreme_model = next(iter(values.keys()))
+                    extreme_model = next(iter(value_str_map))
                     other_values = [
-                        v.value for k, v in values.items()
-                        if k != extreme_model
+                        value for model_name, value in value_str_map.items()
+                        if model_name != extreme_model
                     ]
-                    difference_desc = f"Value of {values[extreme_model].value} vs {', '.join(other_values)}"
+                    difference_desc = f"Value of {value_str_map[extreme_model]} vs {', '.join(other_values)}"
                 
-                differences.append(Difference.create(
+                # Category-only rows (e.g. Release Time) are named by their category
+                add_difference(Difference.create(
                     model=extreme_model,
                     category=section_name,
-                    subcategory=category_name,
-                    specification=spec_name,
+                    subcategory=category_name if spec_name else "",
+                    specification=spec_name or category_name,
                     difference=difference_desc,
                     unit=next(iter(values.values())).unit,
-                    values={k: v.value for k, v in values.items()}
+                    values=value_str_map
                 ))
         
-        return sections, differences 
\ No newline at end of file
+        return differences 
\ No newline at end of file
@@ -2,20 +2,74 @@
 
 import re
 import os
+import glob
+import pickle
+import hashlib
+import asyncio
 import fitz  # PyMuPDF
-import pdfplumber
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import get_config
 from ..transformers import format_display_value, standardize_unit
-from ..models.pdf import (
-    PDFContent, Specification, Category, Section, Page
-)
+from ..models.pdf import PDFContent, Specification
 
 logger = logging.getLogger(__name__)
 
+# Model number patterns used when matching PDF filenames
+_HSR_RE = re.compile(r'HSR-?(\d+[RFW]?)', re.IGNORECASE)
+_PART_RE = re.compile(r'^\d+[RFW]?$', re.IGNORECASE)
+_SPLIT_RE = re.compile(r'[_\s]')
+
+# Category keywords per section; each branch scans the whole category so
+# earlier sections keep priority regardless of keyword position
+_SECTION_CLASSIFIER = re.compile(
+    r'(?=.*?(?P<electrical>power|voltage|current|resistance|capacitance|temperature|electrical))'
+    r'|(?=.*?(?P<magnetic>pull - in|test coil|magnetic))'
+    r'|(?=.*?(?P<physical>capsule|contact material|operate time|release time|physical|operational))',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+
+def _normalize_table(table: List[List[Optional[str]]]) -> List[Tuple[str, ...]]:
+    """Convert a raw extracted table into rows of stripped strings.
+    
+    Args:
+        table: Table rows as returned by the extractor, with None for empty cells
+        
+    Returns:
+        List[Tuple[str, ...]]: The normalized rows
+    """
+    # Extracted cells are already str or None, so no str() call is needed
+    return [tuple((cell or '').strip() for cell in row) for row in table]
+
+
+# Box headings on the first page, skipped when collecting features/advantages
+_HEADINGS = frozenset({"features", "advantages"})
+
+
+def _collect_bbox_lines(page: fitz.Page, box: Tuple[float, float, float, float]) -> List[str]:
+    """Collect the non-empty lines of text inside a page area, minus headings.
+    
+    Args:
+        page: The PDF page to extract from
+        box: The area as (x0, y0, x1, y1)
+        
+    Returns:
+        List[str]: The stripped lines
+    """
+    lines: List[str] = []
+    for line in page.get_textbox(fitz.Rect(*box)).split('\n'):
+        line = line.strip()
+        if not line or line.lower() in _HEADINGS:
+            continue
+        lines.append(line)
+    return lines
+
 
 class PDFProcessorError(Exception):
     """Base error for PDF processing operations."""
@@ -29,6 +83,9 @@ class PDFProcessor:
     extracting and processing content from PDF documents.
     """
     
+    # Shared by every processor; PDF parsing is CPU-bound, so it runs in worker processes
+    _executor: Optional[ProcessPoolExecutor] = None
+    
     def __init__(self, data_dir: Optional[Path] = None):
         """Initialize the processor.
         
@@ -39,6 +96,17 @@ class PDFProcessor:
         self.data_dir = data_dir or Path(self.config.get("pdf_dir", "data/pdfs"))
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Content cache lives in a private per-user directory, namespaced by data directory
+        pdf_config = self.config.get("pdf", {})
+        self.cache_enabled = pdf_config.get("cache", True)
+        data_key = hashlib.sha1(str(self.data_dir.resolve()).encode()).hexdigest()[:12]
+        self._cache_dir = Path(pdf_config.get("cache_dir", Path.home() / ".cache" / "ai_support_agent" / "pdf")) / data_key
+        
+        # Directory index, rebuilt lazily whenever the directory changes
+        self._pdf_stems: Dict[str, Path] = {}
+        self._pdf_models: Dict[str, Path] = {}
+        self._index_mtime: Optional[int] = None
+        
         # Configure section patterns
         self.section_patterns = {
             'electrical': 'electrical specifications',
@@ -46,12 +114,29 @@ class PDFProcessor:
             'physical': 'physical/operational specifications'
         }
         self.section_order = ["electrical", "magnetic", "physical"]
+        
+        # Spec sheet tables are ruled, so detect them from drawn lines only
+        strategy = pdf_config.get("table_strategy", "lines")
+        self.table_settings = {
+            "vertical_strategy": strategy,
+            "horizontal_strategy": strategy,
+            "snap_tolerance": pdf_config.get("table_snap_tolerance", 3),
+            "intersection_tolerance": pdf_config.get("table_intersection_tolerance", 3)
+        }
+        
+        # Per server process; every API worker gets its own pool
+        self.max_workers = pdf_config.get("max_workers", 2)
     
-    async def get_content(self, model_number: str) -> PDFContent:
+    async def get_content(
+        self,
+        model_number: str,
+        pages: Optional[List[int]] = None
+    ) -> PDFContent:
         """Get content for a specific model number.
         
         Args:
             model_number: The model number to get content for
+            pages: Optional 1-based page numbers to process (defaults to all pages)
             
         Returns:
             PDFContent: The processed PDF content
@@ -66,11 +151,21 @@ class PDFProcessor:
             if not pdf_path:
                 raise FileNotFoundError(f"No PDF found for model {model_number}")
             
-            # Extract content
-            content = self._extract_content(pdf_path)
+            # Serve previously processed content while the file is unchanged
+            cache_path = self._cache_path(pdf_path, pages) if self.cache_enabled else None
+            if cache_path is not None:
+                content = self._load_cached_content(cache_path)
+                if content is not None:
+                    return content
             
-            # Extract and save diagram if configured
-            self._extract_diagram(content)
+            # Parse off the event loop so concurrent lookups overlap across cores
+            content = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(self.max_workers), _process_pdf_worker, str(pdf_path), str(self.data_dir), pages
+            )
+            
+            if cache_path is not None:
+                self._store_cached_content(cache_path, content)
+                self._prune_cached_content(pdf_path, cache_path)
             
             return content
             
@@ -80,6 +175,152 @@ class PDFProcessor:
             logger.error(f"Failed to process PDF for model {model_number}: {str(e)}")
             raise PDFProcessorError(f"Failed to process PDF: {str(e)}")
     
+    @classmethod
+    def _get_executor(cls, max_workers: int) -> ProcessPoolExecutor:
+        """Get the shared worker pool, creating it on first use.
+        
+        Workers are spawned rather than forked, so they never inherit the
+        threads (gRPC, asyncio.to_thread) or held locks of the server process.
+        
+        Args:
+            max_workers: Number of worker processes for a new pool
+            
+        Returns:
+            ProcessPoolExecutor: The worker pool
+        """
+        if PDFProcessor._executor is None:
+            PDFProcessor._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return PDFProcessor._executor
+    
+    @classmethod
+    def shutdown_executor(cls) -> None:
+        """Shut down the shared worker pool if it was started."""
+        if PDFProcessor._executor is not None:
+            PDFProcessor._executor.shutdown(cancel_futures=True)
+            PDFProcessor._executor = None
+    
+    def _process_pdf(self, pdf_path: Path, pages: Optional[List[int]] = None) -> PDFContent:
+        """Extract content and diagram from a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Optional 1-based page numbers to process (defaults to all pages)
+            
+        Returns:
+            PDFContent: The processed PDF content
+        """
+        # Parse the document once and share it between the extractors
+        doc = fitz.open(str(pdf_path))
+        try:
+            # Extract content
+            content = self._extract_content(doc, pdf_path, pages)
+            
+            # Extract and save diagram if configured
+            self._extract_diagram(doc, content)
+        finally:
+            doc.close()
+        
+        return content
+    
+    def _cache_path(self, pdf_path: Path, pages: Optional[List[int]] = None) -> Path:
+        """Get the content cache file for a PDF.
+        
+        The key includes the file's modification time and size, so entries
+        for an edited PDF are simply never matched again.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Optional 1-based page numbers the content was limited to
+            
+        Returns:
+            Path: The cache file path
+        """
+        stat = pdf_path.stat()
+        page_key = f"-p{'_'.join(map(str, pages))}" if pages else ""
+        return self._cache_dir / f"{pdf_path.stem}-{stat.st_mtime_ns}-{stat.st_size}{page_key}.pkl"
+    
+    def _load_cached_content(self, cache_path: Path) -> Optional[PDFContent]:
+        """Load processed content from the cache.
+        
+        Args:
+            cache_path: The cache file path
+            
+        Returns:
+            Optional[PDFContent]: The cached content if present and readable
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as e:
+            logger.warning(f"Failed to load cached content {cache_path}: {str(e)}")
+            return None
+    
+    def _store_cached_content(self, cache_path: Path, content: PDFContent) -> None:
+        """Store processed content in the cache.
+        
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partial file.
+        
+        Args:
+            cache_path: The cache file path
+            content: The processed content
+        """
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # Pickles are loaded back without verification, so keep them private
+            self._cache_dir.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._cache_dir.mkdir(mode=0o700, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to cache content {cache_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _prune_cached_content(self, pdf_path: Path, cache_path: Path) -> None:
+        """Remove cache entries left behind by earlier versions of a PDF.
+        
+        Entries for the current version, including other page selections,
+        are kept.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            cache_path: The cache file path of the current version
+        """
+        entry_re = re.compile(rf"{re.escape(pdf_path.stem)}-(\d+-\d+)(?:-p[\d_]+)?\.pkl")
+        current = entry_re.fullmatch(cache_path.name)
+        try:
+            for entry in self._cache_dir.glob(f"{glob.escape(pdf_path.stem)}-*.pkl"):
+                match = entry_re.fullmatch(entry.name)
+                if match and match.group(1) != current.group(1):
+                    entry.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to prune cached content for {pdf_path.name}: {str(e)}")
+    
+    def pdf_version(self, model_number: str) -> Optional[Tuple[str, int, int]]:
+        """Identify the file currently backing a model number.
+        
+        Args:
+            model_number: The model number to look up
+            
+        Returns:
+            Optional[Tuple[str, int, int]]: The PDF path, modification time in
+            nanoseconds and size, or None if no PDF is found
+        """
+        pdf_path = self._find_pdf_file(model_number)
+        if pdf_path is None:
+            return None
+        try:
+            stat = pdf_path.stat()
+        except FileNotFoundError:
+            return None
+        return str(pdf_path), stat.st_mtime_ns, stat.st_size
+    
     def _find_pdf_file(self, model_number: str) -> Optional[Path]:
         """Find a PDF file for the given model number.
         
@@ -89,23 +330,52 @@ class PDFProcessor:
         Returns:
             Optional[Path]: The PDF file path if found
         """
-        # Check if the directory exists
-        if not self.data_dir.exists():
+        # Check if the directory exists, refreshing the index if it changed
+        try:
+            mtime = self.data_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
+        if mtime != self._index_mtime:
+            self._build_index(mtime)
+        
+        model_lower = model_number.lower()
         
         # Look for exact match first
-        for pdf_file in self.data_dir.glob("*.pdf"):
-            if model_number.lower() in pdf_file.stem.lower():
+        pdf_file = self._pdf_stems.get(model_lower)
+        if pdf_file is not None:
+            return pdf_file
+        
+        # Otherwise the model number must appear as a whole token, so "12" never matches "120"
+        pattern = re.compile(rf'(?:^|[_\s-]){re.escape(model_lower)}(?:$|[_\s.-])')
+        for stem, pdf_file in self._pdf_stems.items():
+            if pattern.search(stem):
                 return pdf_file
         
         # If no exact match, try to find a file with a similar name
-        for pdf_file in self.data_dir.glob("*.pdf"):
-            # Extract model number from filename
+        return self._pdf_models.get(model_lower)
+    
+    def _build_index(self, mtime: int) -> None:
+        """Index the PDF files in the data directory.
+        
+        Files are keyed by lowercased stem and by the model number extracted
+        from the filename, so lookups avoid rescanning the directory.
+        
+        Args:
+            mtime: Directory modification time the index reflects
+        """
+        stems: Dict[str, Path] = {}
+        models: Dict[str, Path] = {}
+        for pdf_file in self.data_dir.iterdir():
+            if pdf_file.suffix.lower() != ".pdf":
+                continue
+            stems.setdefault(pdf_file.stem.lower(), pdf_file)
             extracted = self._extract_model_name(pdf_file.stem)
-            if extracted and extracted.lower() == model_number.lower():
-                return pdf_file
+            if extracted:
+                models.setdefault(extracted.lower(), pdf_file)
         
-        return None
+        self._pdf_stems = stems
+        self._pdf_models = models
+        self._index_mtime = mtime
     
     def _extract_model_name(self, filename: str) -> Optional[str]:
         """Extract model number from filename.
@@ -120,15 +390,15 @@ class PDFProcessor:
         base_name = Path(filename).stem
         
         # First try to find HSR-\d+ pattern
-        hsr_match = re.search(r'HSR-?(\d+[RFW]?)', base_name, re.IGNORECASE)
+        hsr_match = _HSR_RE.search(base_name)
         if hsr_match:
             return hsr_match.group(1).upper()
         
         # Then try just the number with optional suffix
-        parts = re.split(r'[_\s]', base_name)
+        parts = _SPLIT_RE.split(base_name)
         for part in parts:
             # Basic pattern: digits followed by optional R/F/W
-            if re.match(r'^\d+[RFW]?$', part, re.IGNORECASE):
+            if _PART_RE.match(part):
                 return part.upper()
         
         # If no match found and input is just digits, use that
@@ -137,17 +407,24 @@ class PDFProcessor:
         
         return None
     
-    def _extract_content(self, pdf_path: Path) -> PDFContent:
+    def _extract_content(
+        self,
+        doc: fitz.Document,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None
+    ) -> PDFContent:
         """Extract content from a PDF file.
         
         Args:
+            doc: The opened PDF document
             pdf_path: Path to the PDF file
+            pages: Optional 1-based page numbers to process (defaults to all pages)
             
         Returns:
             PDFContent: The extracted content
             
         Raises:
-            PDFProcessorError: If content extraction fails
+            PDFProcessorError: If a page is out of range or content extraction fails
         """
         try:
             # Extract model number from filename
@@ -159,45 +436,32 @@ class PDFProcessor:
                 model_number=model_name
             )
             
-            # Extract text and tables
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    # Extract text
-                    text = page.extract_text() or ""
-                    content.add_page(i + 1, text)
-                    
-                    # Extract tables
-                    tables = [
-                        [[str(cell) if cell else '' for cell in row] for row in table]
-                        for table in page.extract_tables()
-                    ]
-                    
-                    # Process features and advantages
-                    if i == 0:  # Only process first page
-                        features_advantages = self._extract_features_advantages(page)
-                        if features_advantages:
-                            content.sections.update(features_advantages)
-                    
-                    # Process specification tables
-                    specs = self._process_tables(tables)
-                    if specs:
-                        for section_name, section_data in specs.items():
-                            if section_name not in content.sections:
-                                content.sections[section_name] = Section(name=section_name)
-                            section = content.sections[section_name]
-                            
-                            for category_name, category_data in section_data.items():
-                                category = section.add_category(category_name)
-                                
-                                for subcategory_name, subcategory_data in category_data.items():
-                                    subcategory = Category(name=subcategory_name)
-                                    category.subcategories[subcategory_name] = subcategory
-                                    
-                                    for spec_name, spec_data in subcategory_data.items():
-                                        value = format_display_value(spec_data["value"])
-                                        unit = standardize_unit(spec_data.get("unit"))
-                                        spec = Specification(name=spec_name, value=value, unit=unit)
-                                        subcategory.add_specification(spec_name, spec)
+            page_numbers = pages or range(1, doc.page_count + 1)
+            
+            # Negative numbers would silently index from the end of the document
+            invalid = [number for number in page_numbers if not 1 <= number <= doc.page_count]
+            if invalid:
+                raise PDFProcessorError(f"Pages {invalid} out of range 1-{doc.page_count}")
+            
+            # Features and advantages live on the first page only
+            if 1 in page_numbers:
+                self._extract_features_advantages(doc[0], content)
+            
+            # Extract text and tables with PyMuPDF
+            for page_number in page_numbers:
+                page = doc[page_number - 1]
+                
+                # Extract text
+                text = page.get_text("text")
+                content.add_page(page_number, text)
+                
+                # Extract tables and stream their specifications straight into the content
+                tables = (
+                    _normalize_table(table.extract())
+                    for table in page.find_tables(**self.table_settings).tables
+                )
+                for section_name, category_name, spec_name, spec in self._iter_specs(tables):
+                    content.add_specification(section_name, category_name, spec_name, spec)
             
             return content
             
@@ -205,88 +469,51 @@ class PDFProcessor:
             logger.error(f"Failed to extract content from {pdf_path}: {str(e)}")
             raise PDFProcessorError(f"Failed to extract content: {str(e)}")
     
-    def _extract_features_advantages(
-        self,
-        page: Any
-    ) -> Optional[Dict[str, Section]]:
-        """Extract features and advantages from a page.
+    def _extract_features_advantages(self, page: fitz.Page, content: PDFContent) -> None:
+        """Extract features and advantages from a page into the content.
         
         Args:
             page: The PDF page to extract from
-            
-        Returns:
-            Optional[Dict[str, Section]]: The extracted features and advantages
+            content: The content to add the features and advantages to
         """
         try:
-            features: List[str] = []
-            advantages: List[str] = []
-            
             # Extract features from left box
-            feat_box = (0, 130, 295, 210)
-            feat_area = page.within_bbox(feat_box)
-            feat_text = feat_area.extract_text()
-            if feat_text:
-                for line in feat_text.split('\n'):
-                    line = line.strip()
-                    if line and line.lower() != 'features':
-                        features.append(line)
+            features = _collect_bbox_lines(page, (0, 130, 295, 210))
             
             # Extract advantages from right box
-            adv_box = (300, 130, 610, 210)
-            adv_area = page.within_bbox(adv_box)
-            adv_text = adv_area.extract_text()
-            if adv_text:
-                for line in adv_text.split('\n'):
-                    line = line.strip()
-                    if line and line.lower() != 'advantages':
-                        advantages.append(line)
-            
-            if not features and not advantages:
-                return None
-            
-            # Create section structure
-            section = Section(name="Features_And_Advantages")
+            advantages = _collect_bbox_lines(page, (300, 130, 610, 210))
             
             if features:
-                category = Category(name="features")
-                spec = Specification(value='\n'.join(features))
-                category.add_specification("", spec)
-                section.add_category("features")
-                section.categories["features"] = category
+                content.add_specification(
+                    "Features_And_Advantages", "features", "", Specification(value='\n'.join(features))
+                )
             
             if advantages:
-                category = Category(name="advantages")
-                spec = Specification(value='\n'.join(advantages))
-                category.add_specification("", spec)
-                section.add_category("advantages")
-                section.categories["advantages"] = category
-            
-            return {"Features_And_Advantages": section}
+                content.add_specification(
+                    "Features_And_Advantages", "advantages", "", Specification(value='\n'.join(advantages))
+                )
             
         except Exception as e:
             logger.warning(f"Failed to extract features/advantages: {str(e)}")
-            return None
     
-    def _process_tables(
+    def _iter_specs(
         self,
-        tables: List[List[List[str]]]
-    ) -> Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]]:
-        """Process specification tables.
+        tables: Iterable[List[Tuple[str, ...]]]
+    ) -> Iterator[Tuple[str, str, str, Specification]]:
+        """Iterate over the specifications in a page's tables.
         
         Args:
-            tables: List of tables to process
+            tables: Normalized tables to process
             
-        Returns:
-            Dict: The processed specifications
+        Yields:
+            Tuple[str, str, str, Specification]: Section, category and
+            specification names with the specification
         """
-        sections: Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]] = {}
-        
         for table in tables:
-            if not table:  # Skip empty tables
+            if len(table) < 2:  # Skip empty and header-only tables
                 continue
             
-            # Clean first row
-            first_row = [str(col).strip() if col else "" for col in table[0]]
+            first_row = table[0]
             
             # Skip features/advantages table
             if (len(first_row) == 2 and
@@ -294,85 +521,48 @@ class PDFProcessor:
                     "Advantages" in first_row[1]):
                 continue
             
-            # Process table into specifications
-            specs = self._parse_table(table)
-            if specs:
-                for section_name, section_data in specs.items():
-                    if section_name not in sections:
-                        sections[section_name] = {}
-                    sections[section_name].update(section_data)
-        
-        return sections
+            yield from self._iter_table_specs(table)
     
-    def _parse_table(
+    def _iter_table_specs(
         self,
-        table: List[List[str]]
-    ) -> Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]]:
-        """Parse a table into specifications.
+        table: List[Tuple[str, ...]]
+    ) -> Iterator[Tuple[str, str, str, Specification]]:
+        """Iterate over the specifications in a table.
+        
+        Rows without a category continue the category above them.
         
         Args:
-            table: The table to parse
+            table: The normalized table to parse
             
-        Returns:
-            Dict: The parsed specifications
+        Yields:
+            Tuple[str, str, str, Specification]: Section, category and
+            specification names with the specification
         """
-        if not table:  # Empty table
-            return {}
-        
-        specs: Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]] = {}
         current_category: Optional[str] = None
         current_section: Optional[str] = None
         
-        # Process rows
-        for row in table[1:]:  # Skip header row
-            try:
-                # Clean row data
-                row_data = [str(cell).strip() if cell else "" for cell in row]
-                
-                if not any(row_data):  # Skip empty rows
-                    continue
-                
-                # Get category and subcategory
-                category = row_data[0] if row_data[0] else current_category
-                subcategory = row_data[1] if len(row_data) > 1 and row_data[1] else ""
-                
-                if category and isinstance(category, str):
-                    current_category = category
-                    # Determine section
-                    section_name = self._get_section_for_category(category, current_section)
-                    current_section = section_name
-                    
-                    # Initialize section structure
-                    if section_name not in specs:
-                        specs[section_name] = {
-                            "categories": {}
-                        }
-                    if category not in specs[section_name]["categories"]:
-                        specs[section_name]["categories"][category] = {
-                            "subcategories": {}
-                        }
-                
-                # Get unit and value
-                if len(row_data) > 3 and current_section and current_category:
-                    raw_unit = row_data[2].strip() if row_data[2] else None
-                    value = row_data[3].strip()
-                    
-                    # Create specification
-                    unit = standardize_unit(raw_unit)
-                    spec = {
-                        "value": value,
-                        "unit": unit,
-                        "display_value": format_display_value(value, unit)
-                    }
-                    
-                    # Add to structure
-                    specs[current_section]["categories"][current_category]["subcategories"][subcategory] = spec
-                    
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse table row: {str(e)}")
+        for row_data in table[1:]:  # Skip header row
+            if not any(row_data):  # Skip empty rows
                 continue
-        
-        return specs
+            
+            # Get category and subcategory
+            category = row_data[0] or current_category
+            subcategory = row_data[1] if len(row_data) > 1 else ""
+            
+            if category:
+                current_category = category
+                current_section = self._get_section_for_category(category, current_section)
+            
+            # Get unit and value
+            if len(row_data) > 3 and current_section:
+                raw_unit = row_data[2] or None
+                value = row_data[3]
+                unit = standardize_unit(raw_unit)
+                yield current_section, current_category, subcategory, Specification(
+                    value=value,
+                    unit=unit.display if unit else raw_unit,
+                    display_value=format_display_value(value, raw_unit)
+                )
     
     def _get_section_for_category(
         self,
@@ -388,35 +578,18 @@ class PDFProcessor:
         Returns:
             str: The determined section name
         """
-        category_lower = category.lower()
-        
-        # Electrical section categories
-        if any(term in category_lower for term in [
-            'power', 'voltage', 'current', 'resistance', 'capacitance',
-            'temperature', 'electrical'
-        ]):
-            return self.section_patterns['electrical']
-        
-        # Magnetic section categories
-        elif any(term in category_lower for term in [
-            'pull - in', 'test coil', 'magnetic'
-        ]):
-            return self.section_patterns['magnetic']
-        
-        # Physical section categories
-        elif any(term in category_lower for term in [
-            'capsule', 'contact material', 'operate time', 'release time',
-            'physical', 'operational'
-        ]):
-            return self.section_patterns['physical']
+        match = _SECTION_CLASSIFIER.match(category)
+        if match:
+            return self.section_patterns[match.lastgroup]
         
         # If no match found, use current section or first section as default
         return current_section or self.section_patterns[self.section_order[0]]
     
-    def _extract_diagram(self, content: PDFContent) -> None:
+    def _extract_diagram(self, doc: fitz.Document, content: PDFContent) -> None:
         """Extract and save diagram from PDF content.
         
         Args:
+            doc: The opened PDF document
             content: The PDF content to extract from
         """
         try:
@@ -429,39 +602,47 @@ class PDFProcessor:
                 os.path.join(os.path.dirname(str(self.data_dir)), "diagrams")
             )
             
-            # Ensure diagram directory exists
-            os.makedirs(diagram_dir, exist_ok=True)
-            
-            # Extract diagram using PyMuPDF
+            # Render the diagram only when an earlier run has not saved it yet
             diagram_path = Path(diagram_dir) / f"{content.model_number}.png"
             if not diagram_path.exists():
                 try:
-                    doc = fitz.open(str(self.data_dir / content.filename))
+                    # Ensure diagram directory exists
+                    os.makedirs(diagram_dir, exist_ok=True)
+                    
                     page = doc[0]  # First page
                     
                     # Get the diagram area (top-right corner)
                     rect = fitz.Rect(300, 0, 600, 120)
                     
-                    # Extract image
+                    # Extract image using PyMuPDF
                     pix = page.get_pixmap(clip=rect)
                     pix.save(str(diagram_path))
-                    doc.close()
                 except Exception as e:
                     logger.warning(f"Failed to extract diagram: {str(e)}")
                     return
             
-            # Add diagram section if image exists
-            if diagram_path.exists():
-                if "Diagram" not in content.sections:
-                    section = Section(name="Diagram")
-                    content.sections["Diagram"] = section
-                    
-                    category = Category(name="")
-                    section.add_category("")
-                    section.categories[""] = category
-                    
-                    spec = Specification(value=str(diagram_path))
-                    category.add_specification("", spec)
-                    
+            # The image exists at this point, whether saved now or by an earlier run
+            content.add_specification("Diagram", "", "", Specification(value=str(diagram_path)))
+        
         except Exception as e:
-            logger.warning(f"Failed to handle diagram: {str(e)}") 
\ No newline at end of file
+            logger.warning(f"Failed to handle diagram: {str(e)}")
+
+
+def _process_pdf_worker(
+    pdf_path: str,
+    data_dir: str,
+    pages: Optional[List[int]] = None
+) -> PDFContent:
+    """Process a PDF in a worker process.
+    
+    Defined at module level so it can be pickled for the process pool.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        data_dir: Directory containing PDF files
+        pages: Optional 1-based page numbers to process (defaults to all pages)
+        
+    Returns:
+        PDFContent: The processed PDF content
+    """
+    return PDFProcessor(Path(data_dir))._process_pdf(Path(pdf_path), pages)